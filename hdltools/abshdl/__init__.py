@@ -4,6 +4,8 @@
 class HDLObject:
     """Abstract class from which all HDL objects derive from."""
 
+    __slots__ = ("parent", "_metadata")
+
     def __init__(self, parent=None, metadata=None, **kwargs):
         """Initialize."""
         self.parent = parent
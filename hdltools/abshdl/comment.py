@@ -5,7 +5,7 @@ from hdltools.abshdl.stmt import HDLStatement
 
 def make_comment(text, tag=None):
     """Make comment."""
-    if len(text.split("\n")) > 1:
+    if "\n" in text:
         return HDLMultiLineComment(text, tag=tag)
     return HDLComment(text, tag=tag)
 
@@ -16,7 +16,7 @@ class HDLComment(HDLStatement):
     def __init__(self, text, **kwargs):
         """Initialize."""
         super().__init__(stmt_type="null", **kwargs)
-        if len(text.split("\n")) > 1:
+        if "\n" in text:
             raise ValueError("cannot have multiline text")
         self.text = text
 
@@ -4,6 +4,9 @@ import math
 
 from hdltools.abshdl import HDLValue
 
+# maximum values for the usual vector widths
+_WIDTH_MASKS = tuple((1 << width) - 1 for width in range(65))
+
 
 class HDLConstant(HDLValue):
     """Abstract class from which other constants inherit."""
@@ -172,7 +175,9 @@ class HDLIntegerConstant(HDLConstant):
         value: int
            The value
         """
-        return bool(value <= (int(math.pow(2, width)) - 1))
+        if 0 <= width < 65:
+            return value <= _WIDTH_MASKS[width]
+        return value <= (1 << width) - 1
 
     @staticmethod
     def minimum_value_size(value):
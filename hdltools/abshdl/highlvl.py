@@ -305,7 +305,7 @@ class HDLBlock(HDLObject, ast.NodeVisitor):
                 )
             if isinstance(node.slice, ast.Index):
                 index = self.visit(node.slice.value)
-                vec = HDLVectorDescriptor(index, index)
+                vec = HDLVectorDescriptor.get(index, index)
                 return HDLSignalSlice(signal, vec)
             elif isinstance(node.slice, ast.Slice):
                 if isinstance(node.slice.upper, ast.Constant):
@@ -319,7 +319,7 @@ class HDLBlock(HDLObject, ast.NodeVisitor):
                 return HDLSignalSlice(signal, [upper, lower])
             elif isinstance(node.slice, ast.Constant):
                 if isinstance(node.slice.value, int):
-                    vec = HDLVectorDescriptor(
+                    vec = HDLVectorDescriptor.get(
                         node.slice.value, node.slice.value
                     )
                     return HDLSignalSlice(signal, vec)
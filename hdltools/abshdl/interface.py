@@ -2,7 +2,8 @@
 
 import copy
 import re
-from typing import Dict, Tuple, Union
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Union
 
 from hdltools.abshdl import HDLObject
 from hdltools.abshdl.port import HDLModulePort
@@ -14,12 +15,29 @@ class HDLModuleInterfaceError(Exception):
     """Interface description error."""
 
 
+def _freeze_port(config):
+    """Get read-only port description."""
+    if isinstance(config, MappingProxyType):
+        return config
+    return MappingProxyType(dict(config))
+
+
 class HDLModuleInterface(HDLObject):
     """Module interface."""
 
-    _PORTS: Dict[str, Dict[str, Union[str, int]]] = {}
+    _PORTS: Mapping[str, Mapping[str, Union[str, int]]] = {}
     _ALIASES: Dict[str, Tuple[str]] = {}
 
+    def __init_subclass__(cls, **kwargs):
+        """Freeze port descriptions of subclasses."""
+        super().__init_subclass__(**kwargs)
+        ports = cls.__dict__.get("_PORTS")
+        if ports is not None and not isinstance(ports, MappingProxyType):
+            # read-only, so descriptions can be shared between interfaces
+            cls._PORTS = MappingProxyType(
+                {name: _freeze_port(config) for name, config in ports.items()}
+            )
+
     def __init__(self):
         """Initialize."""
         super().__init__()
@@ -147,9 +165,11 @@ class HDLModuleInterface(HDLObject):
                     flipped_dir = config["dir"]
             else:
                 flipped_dir = config["dir"]
-            _config = config.copy()
-            _config["dir"] = flipped_dir
-            flipped_ports[name] = _config
+            if flipped_dir == config["dir"]:
+                # unchanged, share description
+                flipped_ports[name] = config
+            else:
+                flipped_ports[name] = {**config, "dir": flipped_dir}
 
         return flipped_ports
 
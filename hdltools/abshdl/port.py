@@ -91,17 +91,17 @@ class HDLModulePort(HDLAbsModulePort):
             # default is [size-1:0] / (size-1 downto 0)
             if size < 0:
                 raise ValueError("only positive size allowed")
-            self.vector = HDLVectorDescriptor(size - 1, 0)
+            self.vector = HDLVectorDescriptor.get(size - 1, 0)
         elif isinstance(size, (tuple, list)):
             if len(size) != 2:
                 raise ValueError(
                     "invalid vector " 'dimensions: "{}"'.format(size)
                 )
-            self.vector = HDLVectorDescriptor(*size)
+            self.vector = HDLVectorDescriptor.get(*size)
         elif isinstance(size, HDLVectorDescriptor):
             self.vector = size
         elif isinstance(size, HDLExpression):
-            self.vector = HDLVectorDescriptor(left_size=size - 1)
+            self.vector = HDLVectorDescriptor.get(left_size=size - 1)
         else:
             raise TypeError(
                 "size can only be of types: int, list or"
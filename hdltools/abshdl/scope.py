@@ -1,21 +1,31 @@
 """Scope."""
 
-import types
-
 from hdltools.abshdl import HDLObject
 from hdltools.abshdl.comment import make_comment
 from hdltools.abshdl.stmt import HDLStatement
 
 
+def _get_sub_scopes(statement):
+    """Get scopes of a statement, always as a tuple."""
+    scopes = statement.get_scope()
+    if scopes is None:
+        return ()
+    if isinstance(scopes, HDLScope):
+        return (scopes,)
+    return tuple(scopes)
+
+
 class HDLScope(HDLObject):
     """Scope."""
 
-    _scope_types = ["seq", "par"]
+    _scope_types = frozenset(("seq", "par"))
 
     def __init__(self, scope_type, **kwargs):
         """Initialize."""
         super().__init__(**kwargs)
         self.statements = []
+        # statements bucketed by exact type, rebuilt lazily when invalidated
+        self._by_type = {}
         if scope_type not in self._scope_types:
             raise KeyError("invalid scope type")
 
@@ -48,20 +58,36 @@ class HDLScope(HDLObject):
 
     def add(self, elements):
         """Add elements to scope."""
-        if isinstance(elements, (tuple, list, types.GeneratorType)):
-            for element in elements:
-                self.statements.append(self._check_element(element))
-                if isinstance(element, HDLObject):
-                    element.set_parent(self)
+        if isinstance(elements, (list, tuple)):
+            # validate everything first, then grow the statement list once
+            checked = list(map(self._check_element, elements))
+        elif isinstance(elements, (HDLObject, str)) or not hasattr(
+            elements, "__iter__"
+        ):
+            # other HDL objects such as scopes are rejected here
+            checked = [self._check_element(elements)]
         else:
-            self.statements.append(self._check_element(elements))
-            if isinstance(elements, HDLObject):
-                elements.set_parent(self)
+            # lazy iterables may look up elements they produced earlier
+            for element in elements:
+                element = self._check_element(element)
+                self.statements.append(element)
+                self._adopt(element)
+            return
+        self.statements.extend(checked)
+        for element in checked:
+            self._adopt(element)
+
+    def _adopt(self, element):
+        """Take ownership of an element already in the statement list."""
+        element.set_parent(self)
+        if self._by_type is not None:
+            self._by_type.setdefault(type(element), []).append(element)
 
     def remove(self, element):
         if element not in self.statements:
             raise ValueError("element not in statements")
         self.statements.remove(element)
+        self._by_type = None
 
     def extend(self, scope):
         """Extend from another scope."""
@@ -75,28 +101,30 @@ class HDLScope(HDLObject):
 
     def insert(self, where, *elements):
         """Insert elements."""
-        for index, element in enumerate(elements):
-            self.statements.insert(where + index, self._check_element(element))
-            if isinstance(element, HDLObject):
-                element.set_parent(self)
+        checked = [self._check_element(element) for element in elements]
+        self.statements[where:where] = checked
+        for element in checked:
+            element.set_parent(self)
+        # buckets must follow statement order, rebuild on next lookup
+        self._by_type = None
 
     def insert_before(self, tag, *elements):
         """Insert before tag."""
-        try:
-            scope, element = self.find_by_tag(tag)
-        except (ValueError, TypeError):
-            raise IndexError("could not find tag:" " {}".format(tag))
+        found = self.find_by_tag(tag)
+        if found is None:
+            raise IndexError("could not find tag: {}".format(tag))
 
-        self.insert(element[0], *elements)
+        scope, (index, _) = found
+        scope.insert(index, *elements)
 
     def insert_after(self, tag, *elements):
         """Insert after tag."""
-        try:
-            scope, element = self.find_by_tag(tag)
-        except (ValueError, TypeError):
-            raise IndexError("could not find tag:" " {}".format(tag))
+        found = self.find_by_tag(tag)
+        if found is None:
+            raise IndexError("could not find tag: {}".format(tag))
 
-        scope.insert(element[0] + 1, *elements)
+        scope, (index, _) = found
+        scope.insert(index + 1, *elements)
 
     def get_tags(self):
         """Get available tags in this scope."""
@@ -105,43 +133,52 @@ class HDLScope(HDLObject):
             if statement.tag is not None:
                 tags.append(statement.tag)
 
-            scopes = statement.get_scope()
-            if isinstance(scopes, HDLScope):
-                tags.extend(scopes.get_tags())
-            elif isinstance(scopes, (list, tuple)):
-                for scope in scopes:
-                    tags.extend(scope.get_tags())
+            for scope in _get_sub_scopes(statement):
+                tags.extend(scope.get_tags())
         return tags
 
     def find_by_tag(self, tag):
         """Find element by tag."""
-        for index, element in enumerate(self.statements):
-            if element.tag == tag:
-                return (self, (index, element))
-
-            # recursion
-            scopes = element.get_scope()
-            if isinstance(scopes, HDLScope):
-                # search
-                _element = scopes.find_by_tag(tag)
-                if _element is not None:
-                    return _element
-            elif isinstance(scopes, (list, tuple)):
-                for scope in scopes:
-                    _element = scope.find_by_tag(tag)
-                    if _element is not None:
-                        return _element
+        # depth-first, same visiting order as a recursive search
+        stack = [(self, enumerate(self.statements))]
+        while stack:
+            scope, elements = stack[-1]
+            for index, element in elements:
+                if element.tag == tag:
+                    return (scope, (index, element))
+
+                sub_scopes = _get_sub_scopes(element)
+                if sub_scopes:
+                    stack.extend(
+                        (sub_scope, enumerate(sub_scope.statements))
+                        for sub_scope in reversed(sub_scopes)
+                    )
+                    break
+            else:
+                stack.pop()
 
         return None
 
     def get_by_type(self, element_type):
         """Get list of elements by type."""
-        element_list = []
-        for element in self.statements:
-            if isinstance(element, element_type):
-                element_list.append(element)
-
-        return element_list
+        if self._by_type is None:
+            self._by_type = {}
+            for element in self.statements:
+                self._by_type.setdefault(type(element), []).append(element)
+
+        types = [
+            _type for _type in self._by_type if issubclass(_type, element_type)
+        ]
+        if not types:
+            return []
+        if len(types) == 1:
+            return list(self._by_type[types[0]])
+
+        # several buckets match, scan to keep statement order
+        types = frozenset(types)
+        return [
+            element for element in self.statements if type(element) in types
+        ]
 
     def __len__(self):
         """Get statement count."""
@@ -151,6 +188,10 @@ class HDLScope(HDLObject):
         """Get scope item."""
         return self.statements[_slice]
 
+    def __iter__(self):
+        """Iterate over statements."""
+        return iter(self.statements)
+
     def dumps(self):
         """Get intermediate representation."""
         return "\n".join([x.dumps() for x in self.statements])
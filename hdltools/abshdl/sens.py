@@ -1,14 +1,15 @@
 """Sensitivity lists."""
 
+import weakref
+
 from hdltools.abshdl import HDLObject
 from hdltools.abshdl.signal import HDLSignal, HDLSignalSlice
-from hdltools.abshdl.port import HDLModulePort
 
 
 class HDLSensitivityDescriptor(HDLObject):
     """Signal sensitivity descriptor."""
 
-    _sens_types = ["rise", "fall", "both", "any"]
+    _sens_types = frozenset(("rise", "fall", "both", "any"))
 
     def __init__(self, sens_type, sig=None, **kwargs):
         """Initialize."""
@@ -17,10 +18,12 @@ class HDLSensitivityDescriptor(HDLObject):
                 "illegal sensitivity" ' type: "{}"'.format(sens_type)
             )
 
-        if isinstance(sig, HDLModulePort):
-            sig = sig.signal
-        elif sig is None and sens_type != "any":
-            raise ValueError("signal cannot be None")
+        if sig is None:
+            if sens_type != "any":
+                raise ValueError("signal cannot be None")
+        elif not isinstance(sig, (HDLSignal, HDLSignalSlice)):
+            # module ports and other objects wrapping a signal
+            sig = getattr(sig, "signal", sig)
 
         if not isinstance(sig, (HDLSignal, HDLSignalSlice, type(None))):
             raise TypeError("sig must be HDLSignal or HDLSignalSlice")
@@ -29,6 +32,23 @@ class HDLSensitivityDescriptor(HDLObject):
         self.signal = sig
         super().__init__(**kwargs)
 
+    # descriptors keyed by signal identity, shared while in use; a live
+    # descriptor references its signal, so the id cannot be reused
+    _interned = weakref.WeakValueDictionary()
+
+    @classmethod
+    def get(cls, sens_type, sig=None):
+        """Get descriptor, sharing instances for the same signal."""
+        if not isinstance(sig, (HDLSignal, HDLSignalSlice)):
+            return cls(sens_type, sig)
+
+        key = (cls, sens_type, id(sig))
+        descr = cls._interned.get(key)
+        if descr is None:
+            descr = cls(sens_type, sig)
+            cls._interned[key] = descr
+        return descr
+
     def dumps(self):
         """Get representation."""
         if self.sens_type == "rise":
@@ -52,13 +72,20 @@ class HDLSensitivityList(HDLObject):
         self.add(*descrs)
 
     def add(self, *descrs):
-        """Add descriptors."""
+        """Add descriptors.
+
+        Descriptors can also be given as (sens_type, sig) tuples.
+        """
+        append = self.items.append
         for descr in descrs:
-            if not isinstance(descr, HDLSensitivityDescriptor):
-                raise TypeError("only HDLSensitivityDescriptor allowed")
+            if type(descr) is not HDLSensitivityDescriptor:
+                if isinstance(descr, tuple):
+                    descr = HDLSensitivityDescriptor(*descr)
+                elif not isinstance(descr, HDLSensitivityDescriptor):
+                    raise TypeError("only HDLSensitivityDescriptor allowed")
 
             # no duplicate checking!!!
-            self.items.append(descr)
+            append(descr)
 
     def __len__(self):
         """Get item count."""
@@ -25,11 +25,15 @@ class HDLSequentialBlock(HDLStatement):
 
     def dumps(self):
         """Get representation."""
-        ret_str = "SEQ({}) BEGIN\n".format(self.sens_list.dumps())
-        ret_str += self.scope.dumps()
-        ret_str += "\nEND\n"
-
-        return ret_str
+        return "".join(
+            (
+                "SEQ(",
+                self.sens_list.dumps(),
+                ") BEGIN\n",
+                self.scope.dumps(),
+                "\nEND\n",
+            )
+        )
 
     def is_legal(self):
         """Check legality."""
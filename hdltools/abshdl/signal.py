@@ -1,5 +1,9 @@
 """HDL Signals."""
 
+import ast
+import operator
+import weakref
+
 from hdltools.abshdl import HDLObject
 import hdltools.abshdl as hdl
 from hdltools.abshdl.stmt import HDLStatement
@@ -19,10 +23,200 @@ class HDLSignalPartSelect(HDLObject):
         self.length = length
 
 
-class HDLSignal(HDLStatement):
+# signal names and types recur across a design, keep one copy of each
+_NAME_POOL = {}
+
+
+def _dedup(text):
+    """Get pooled copy of a string."""
+    if type(text) is not str:
+        return text
+    return _NAME_POOL.setdefault(text, text)
+
+
+def _to_expression(value):
+    """Wrap value in an expression, unless it already is one."""
+    if value is None:
+        return None
+    expr_type = hdl.expr.HDLExpression
+    if type(value) is expr_type or isinstance(value, expr_type):
+        return value
+    return expr_type(value)
+
+
+def _vector_from_int(size):
+    """Build vector from integer size."""
+    # default is [size-1:0] / (size-1 downto 0)
+    if size < 0:
+        raise ValueError("only positive size allowed")
+    return hdl.vector.HDLVectorDescriptor.get(size - 1, 0)
+
+
+def _vector_from_sequence(size):
+    """Build vector from (left, right) pair."""
+    if len(size) != 2:
+        raise ValueError("invalid vector " 'dimensions: "{}"'.format(size))
+    return hdl.vector.HDLVectorDescriptor.get(*size)
+
+
+# size - 1 expressions keyed by id of the size expression; entries are
+# dropped when the size expression is collected, so ids are never reused
+_SIZE_MINUS_ONE = {}
+
+
+def _vector_from_expression(size):
+    """Build vector from expression size, sharing the size - 1 expression."""
+    key = id(size)
+    left_size = _SIZE_MINUS_ONE.get(key)
+    if left_size is None:
+        left_size = size - 1
+        _SIZE_MINUS_ONE[key] = left_size
+        weakref.finalize(size, _SIZE_MINUS_ONE.pop, key, None)
+    return hdl.vector.HDLVectorDescriptor.get(left_size)
+
+
+# fast paths for the most common size argument types
+_SIZE_HANDLERS = {
+    int: _vector_from_int,
+    tuple: _vector_from_sequence,
+    list: _vector_from_sequence,
+}
+
+
+def _is_constant(expr, value):
+    """Check whether an expression is a given integer constant."""
+    body = getattr(expr.tree, "body", None)
+    return isinstance(body, ast.Constant) and body.value == value
+
+
+def _is_full_width(vector, slic):
+    """Check whether a python slice spans a whole vector."""
+    if vector is None or vector.part_select:
+        return False
+    stop = 0 if slic.stop is None else slic.stop
+    if type(stop) is not int:
+        return False
+    if slic.start is not None and (
+        type(slic.start) is not int
+        or not _is_constant(vector.left_size, slic.start)
+    ):
+        return False
+    return _is_constant(vector.right_size, stop)
+
+
+def _get_slice_key(key):
+    """Get hashable key for constant slices, None if not cacheable."""
+    if type(key) is int:
+        return key
+    if type(key) is slice and key.step is None:
+        if type(key.stop) is int and (
+            key.start is None or type(key.start) is int
+        ):
+            return (key.start, key.stop)
+    return None
+
+
+def _make_binop(operator_fn, doc):
+    """Make operator method with the signal as left-hand side."""
+
+    def binop(self, other):
+        return operator_fn(self._as_expr(), other)
+
+    binop.__doc__ = doc
+    return binop
+
+
+def _make_rbinop(operator_fn, doc):
+    """Make operator method with the signal as right-hand side."""
+
+    def rbinop(self, other):
+        return operator_fn(other, self._as_expr())
+
+    rbinop.__doc__ = doc
+    return rbinop
+
+
+class _HDLExpressionOperators:
+    """Operators for objects that can be used as expressions.
+
+    Subclasses provide the _expr slot used to cache the expression, or
+    override _as_expr.
+    """
+
+    __slots__ = ()
+
+    def _as_expr(self):
+        """Get shared expression wrapper, used to build larger expressions."""
+        if self._expr is None:
+            self._expr = hdl.expr.HDLExpression(self)
+        return self._expr
+
+    __add__ = _make_binop(operator.add, "Add expressions.")
+    __radd__ = _make_rbinop(operator.add, "Add expressions.")
+    __sub__ = _make_binop(operator.sub, "Subtract expressions.")
+    __rsub__ = _make_rbinop(operator.sub, "Subtract expressions.")
+    __mul__ = _make_binop(operator.mul, "Multiply expressions.")
+    __rmul__ = _make_rbinop(operator.mul, "Multiply expressions.")
+    __truediv__ = _make_binop(operator.truediv, "Divide expressions.")
+    __lshift__ = _make_binop(operator.lshift, "Shift operator.")
+    __rshift__ = _make_binop(operator.rshift, "Shift operator.")
+    __or__ = _make_binop(operator.or_, "Bitwise OR.")
+    __ror__ = _make_rbinop(operator.or_, "Reverse Bitwise OR.")
+    __and__ = _make_binop(operator.and_, "Bitwise AND.")
+    __rand__ = _make_rbinop(operator.and_, "Reverse Bitwise AND.")
+    __xor__ = _make_binop(operator.xor, "Bitwise XOR.")
+    __rxor__ = _make_rbinop(operator.xor, "Reverse Bitwise XOR.")
+    __gt__ = _make_binop(operator.gt, "Greater than.")
+    __lt__ = _make_binop(operator.lt, "Less than.")
+    __ge__ = _make_binop(operator.ge, "Greater or equal.")
+    __le__ = _make_binop(operator.le, "Less or equal.")
+
+    def __invert__(self):
+        """Bitwise negation."""
+        return ~self._as_expr()
+
+    def bool_neg(self):
+        """Boolean negation."""
+        return self._as_expr().bool_neg()
+
+    def bool_and(self, other):
+        """Boolean AND."""
+        return self._as_expr().bool_and(other)
+
+    def bool_or(self, other):
+        """Boolean OR."""
+        return self._as_expr().bool_or(other)
+
+    def __eq__(self, other):
+        """Comparison."""
+        return self._as_expr() == other
+
+    def __ne__(self, other):
+        """Not equal."""
+        return self._as_expr() != other
+
+    # __eq__ builds expressions, so hash by identity to stay usable as keys;
+    # containers compare identity first and never reach __eq__ for them
+    __hash__ = object.__hash__
+
+
+class HDLSignal(_HDLExpressionOperators, HDLStatement):
     """HDL Signal."""
 
-    _types = ["comb", "reg", "const", "var", "other"]
+    __slots__ = (
+        "sig_type",
+        "_sig_type_upper",
+        "_name",
+        "var_type",
+        "default_val",
+        "_vector",
+        "defer",
+        "_repr_cache",
+        "_expr",
+        "_slices",
+    )
+
+    _types = frozenset(("comb", "reg", "const", "var", "other"))
 
     def __init__(self, sig_type, sig_name, size=1, default_val=None, **kwargs):
         """Initialize."""
@@ -31,38 +225,30 @@ class HDLSignal(HDLStatement):
         if sig_type not in self._types:
             raise ValueError('invalid signal type: "{}"'.format(sig_type))
 
-        self.sig_type = sig_type
-        self.name = sig_name
+        self.sig_type = _dedup(sig_type)
+        self._sig_type_upper = sig_type.upper()
+        self.name = _dedup(sig_name)
         self.var_type = None
-        if isinstance(default_val, hdl.expr.HDLExpression):
-            self.default_val = default_val
-        elif default_val is None:
-            self.default_val = default_val
-        else:
-            self.default_val = hdl.expr.HDLExpression(default_val)
+        self.default_val = _to_expression(default_val)
 
-        if isinstance(size, int):
-            # default is [size-1:0] / (size-1 downto 0)
-            if size < 0:
-                raise ValueError("only positive size allowed")
-            self.vector = hdl.vector.HDLVectorDescriptor(size - 1, 0)
+        handler = _SIZE_HANDLERS.get(type(size))
+        if handler is not None:
+            self.vector = handler(size)
+        elif isinstance(size, int):
+            self.vector = _vector_from_int(size)
         elif isinstance(size, (tuple, list)):
-            if len(size) != 2:
-                raise ValueError(
-                    "invalid vector " 'dimensions: "{}"'.format(size)
-                )
-            self.vector = hdl.vector.HDLVectorDescriptor(*size)
+            self.vector = _vector_from_sequence(size)
         elif isinstance(size, hdl.vector.HDLVectorDescriptor):
             self.vector = size
         elif isinstance(size, hdl.expr.HDLExpression):
-            self.vector = hdl.vector.HDLVectorDescriptor(size - 1)
+            self.vector = _vector_from_expression(size)
         elif size == "auto":
             if default_val is not None:
                 eval_def_val = default_val.evaluate(**kwargs)
             else:
                 raise ValueError("cannot determine size automatically")
             min_size = HDLIntegerConstant.minimum_value_size(eval_def_val)
-            self.vector = hdl.vector.HDLVectorDescriptor(min_size)
+            self.vector = hdl.vector.HDLVectorDescriptor.get(min_size)
         elif size == "defer":
             self.vector = None
             self.defer = True
@@ -82,21 +268,63 @@ class HDLSignal(HDLStatement):
                 " HDLVectorDescriptor"
             )
 
+    @property
+    def name(self):
+        """Get signal name."""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """Set signal name."""
+        self._name = value
+        self._repr_cache = None
+        self._expr = None
+
+    @property
+    def vector(self):
+        """Get vector descriptor."""
+        return self._vector
+
+    @vector.setter
+    def vector(self, value):
+        """Set vector descriptor."""
+        self._vector = value
+        self._repr_cache = None
+        self._expr = None
+        self._slices = None
+
     def __getitem__(self, key):
         """Slice of signal."""
-        return HDLSignalSlice(self, key)
+        cache_key = _get_slice_key(key)
+        if cache_key is None:
+            return HDLSignalSlice(self, key)
+
+        # identical constant slices share the same object
+        if self._slices is None:
+            self._slices = {}
+        sig_slice = self._slices.get(cache_key)
+        if sig_slice is None:
+            sig_slice = HDLSignalSlice(self, key)
+            self._slices[cache_key] = sig_slice
+        return sig_slice
 
     def __repr__(self, eval_scope=None, decl=True):
         """Get readable representation."""
-        if decl is True:
-            if self.vector is None:
-                vec = ""
-            else:
-                vec = self.vector.dumps(eval_scope)
+        if decl is False:
+            return self.name
 
-            ret_str = "{} {}{} ".format(self.sig_type.upper(), self.name, vec)
+        # declaration without evaluation is by far the most common case
+        if eval_scope is None and self._repr_cache is not None:
+            return self._repr_cache
+
+        if self.vector is None:
+            vec = ""
         else:
-            ret_str = self.name
+            vec = self.vector.dumps(eval_scope)
+
+        ret_str = f"{self._sig_type_upper} {self.name}{vec} "
+        if eval_scope is None:
+            self._repr_cache = ret_str
 
         return ret_str
 
@@ -113,7 +341,7 @@ class HDLSignal(HDLStatement):
     def set_size(self, size):
         """Set signal size."""
         if self.defer is True:
-            self.vector = hdl.vector.HDLVectorDescriptor(size - 1)
+            self.vector = hdl.vector.HDLVectorDescriptor.get(size - 1)
             self.defer = False
         else:
             raise RuntimeError("cannot set signal size, already set")
@@ -122,150 +350,6 @@ class HDLSignal(HDLStatement):
         """Check legality."""
         return True
 
-    # TODO: rewrite docstrings
-
-    def __add__(self, other):
-        """Add expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as right-hand side
-        """
-        return hdl.expr.HDLExpression(self) + other
-
-    def __radd__(self, other):
-        """Add expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as left-hand side
-        """
-        return other + hdl.expr.HDLExpression(self)
-
-    def __sub__(self, other):
-        """Subtract expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as right-hand side
-        """
-        return hdl.expr.HDLExpression(self) - other
-
-    def __rsub__(self, other):
-        """Subtract expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as left-hand side
-        """
-        return other - hdl.expr.HDLExpression(self)
-
-    def __mul__(self, other):
-        """Multiply expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as right-hand side
-        """
-        return hdl.expr.HDLExpression(self) * other
-
-    def __rmul__(self, other):
-        """Multiply expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as left-hand side
-        """
-        return other * hdl.expr.HDLExpression(self)
-
-    def __truediv__(self, other):
-        """Divide expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as right-hand side
-        """
-        return hdl.expr.HDLExpression(self) / other
-
-    def __lshift__(self, val):
-        """Shift operator."""
-        return hdl.expr.HDLExpression(self) << val
-
-    def __rshift__(self, val):
-        """Shift operator."""
-        return hdl.expr.HDLExpression(self) >> val
-
-    def __or__(self, other):
-        """Bitwise OR."""
-        return hdl.expr.HDLExpression(self) | other
-
-    def __ror__(self, other):
-        """Reverse Bitwise OR."""
-        return other | hdl.expr.HDLExpression(self)
-
-    def __and__(self, other):
-        """Bitwise AND."""
-        return hdl.expr.HDLExpression(self) & other
-
-    def __rand__(self, other):
-        """Reverse Bitwise AND."""
-        return other & hdl.expr.HDLExpression(self)
-
-    def __xor__(self, other):
-        """Bitwise XOR."""
-        return hdl.expr.HDLExpression(self) ^ other
-
-    def __rxor__(self, other):
-        """Reverse Bitwise XOR."""
-        return other ^ hdl.expr.HDLExpression(self)
-
-    def __invert__(self):
-        """Bitwise negation."""
-        return ~hdl.expr.HDLExpression(self)
-
-    def bool_neg(self):
-        """Boolean negation."""
-        return hdl.expr.HDLExpression(self).bool_neg()
-
-    def bool_and(self, other):
-        """Boolean AND."""
-        return hdl.expr.HDLExpression(self).bool_and(other)
-
-    def bool_or(self, other):
-        """Boolean OR."""
-        return hdl.expr.HDLExpression(self).bool_or(other)
-
-    def __eq__(self, other):
-        """Comparison."""
-        return hdl.expr.HDLExpression(self) == other
-
-    def __ne__(self, other):
-        """Not equal."""
-        return hdl.expr.HDLExpression(self) != other
-
-    def __gt__(self, other):
-        """Greater than."""
-        return hdl.expr.HDLExpression(self) > other
-
-    def __lt__(self, other):
-        """Less than."""
-        return hdl.expr.HDLExpression(self) < other
-
-    def __ge__(self, other):
-        """Greater or equal."""
-        return hdl.expr.HDLExpression(self) >= other
-
-    def __le__(self, other):
-        """Less or equal."""
-        return hdl.expr.HDLExpression(self) <= other
-
     def __pos__(self):
         """Get an expression for the signal."""
         return hdl.expr.HDLExpression(self)
@@ -295,48 +379,82 @@ class HDLSignal(HDLStatement):
         )
 
 
-class HDLSignalSlice(HDLObject):
+class HDLSignalSlice(_HDLExpressionOperators, HDLObject):
     """Slice of a vector signal."""
 
+    __slots__ = ("signal", "_vector", "_vector_repr")
+
     def __init__(self, signal, slic):
         """Initialize."""
         if not isinstance(signal, HDLSignal):
             raise TypeError("only HDLSignal allowed")
 
         self.signal = signal
-
-        if isinstance(slic, int):
+        self._vector_repr = None
+
+        # python slices are by far the most common, test them first
+        if type(slic) is slice:
+            vector = signal.vector
+            if _is_full_width(vector, slic):
+                # reuse the signal's own descriptor
+                self.vector = vector
+            elif slic.start is None:
+                self.vector = hdl.vector.HDLVectorDescriptor.get(
+                    vector.left_size, slic.stop
+                )
+            else:
+                self.vector = hdl.vector.HDLVectorDescriptor.get(
+                    slic.start, slic.stop
+                )
+        elif isinstance(slic, int):
             # default is [size-1:0] / (size-1 downto 0)
             if slic < 0:
                 raise ValueError("only positive integers allowed")
-            self.vector = hdl.vector.HDLVectorDescriptor(slic, slic)
+            self.vector = hdl.vector.HDLVectorDescriptor.get(slic, slic)
         elif isinstance(slic, (tuple, list)):
             if len(slic) != 2:
                 raise ValueError(
                     "invalid vector " 'dimensions: "{}"'.format(slic)
                 )
-            self.vector = hdl.vector.HDLVectorDescriptor(*slic)
+            self.vector = hdl.vector.HDLVectorDescriptor.get(*slic)
         elif isinstance(slic, hdl.vector.HDLVectorDescriptor):
             self.vector = slic
-        elif isinstance(slic, slice):
-            if slic.start is None:
-                start = self.signal.vector.left_size
-            else:
-                start = slic.start
-            self.vector = hdl.vector.HDLVectorDescriptor(start, slic.stop)
         elif isinstance(slic, HDLSignal):
-            self.vector = hdl.vector.HDLVectorDescriptor(slic, slic)
+            self.vector = hdl.vector.HDLVectorDescriptor.get(slic, slic)
         elif isinstance(slic, HDLSignalPartSelect):
-            self.vector = hdl.vector.HDLVectorDescriptor(slic)
+            self.vector = hdl.vector.HDLVectorDescriptor.get(slic)
         else:
             raise TypeError(
                 "size can only be of types: int, list, slice,"
                 " HDLVectorDescriptor or HDLSignal"
             )
 
+    @property
+    def vector(self):
+        """Get vector descriptor."""
+        return self._vector
+
+    @vector.setter
+    def vector(self, value):
+        """Set vector descriptor."""
+        self._vector = value
+        self._vector_repr = None
+
+    def _as_expr(self):
+        """Get expression wrapper."""
+        # not cached: slices are shared and expressions embed the signal
+        # name, which can still change
+        return hdl.expr.HDLExpression(self)
+
     def __repr__(self, eval_scope=None):
         """Get representation."""
-        return "{}{}".format(self.signal.name, self.vector.dumps(eval_scope))
+        if eval_scope is not None:
+            vec = self.vector.dumps(eval_scope)
+        elif self._vector_repr is not None:
+            vec = self._vector_repr
+        else:
+            vec = self._vector_repr = self.vector.dumps()
+        return f"{self.signal.name}{vec}"
 
     def dumps(self, eval_scope=None):
         """Alias for __repr__."""
@@ -350,148 +468,6 @@ class HDLSignalSlice(HDLObject):
         """Return an assignment."""
         return hdl.assign.HDLAssignment(self, value, **kwargs)
 
-    def __add__(self, other):
-        """Add expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as right-hand side
-        """
-        return hdl.expr.HDLExpression(self) + other
-
-    def __radd__(self, other):
-        """Add expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as left-hand side
-        """
-        return other + hdl.expr.HDLExpression(self)
-
-    def __sub__(self, other):
-        """Subtract expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as right-hand side
-        """
-        return hdl.expr.HDLExpression(self) - other
-
-    def __rsub__(self, other):
-        """Subtract expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as left-hand side
-        """
-        return other - hdl.expr.HDLExpression(self)
-
-    def __mul__(self, other):
-        """Multiply expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as right-hand side
-        """
-        return hdl.expr.HDLExpression(self) * other
-
-    def __rmul__(self, other):
-        """Multiply expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as left-hand side
-        """
-        return other * hdl.expr.HDLExpression(self)
-
-    def __truediv__(self, other):
-        """Divide expressions.
-
-        Args
-        ----
-        other: HDLExpression, HDLIntegerConstant, int
-           Value to be used as right-hand side
-        """
-        return hdl.expr.HDLExpression(self) / other
-
-    def __lshift__(self, val):
-        """Shift operator."""
-        return hdl.expr.HDLExpression(self) << val
-
-    def __rshift__(self, val):
-        """Shift operator."""
-        return hdl.expr.HDLExpression(self) >> val
-
-    def __or__(self, other):
-        """Bitwise OR."""
-        return hdl.expr.HDLExpression(self) | other
-
-    def __ror__(self, other):
-        """Reverse Bitwise OR."""
-        return other | hdl.expr.HDLExpression(self)
-
-    def __and__(self, other):
-        """Bitwise AND."""
-        return hdl.expr.HDLExpression(self) & other
-
-    def __rand__(self, other):
-        """Reverse Bitwise AND."""
-        return other & hdl.expr.HDLExpression(self)
-
-    def __xor__(self, other):
-        """Bitwise XOR."""
-        return hdl.expr.HDLExpression(self) ^ other
-
-    def __rxor__(self, other):
-        """Reverse Bitwise XOR."""
-        return other ^ hdl.expr.HDLExpression(self)
-
-    def __invert__(self):
-        """Bitwise negation."""
-        return ~hdl.expr.HDLExpression(self)
-
-    def bool_neg(self):
-        """Boolean negation."""
-        return hdl.expr.HDLExpression(self).bool_neg()
-
-    def bool_and(self, other):
-        """Boolean AND."""
-        return hdl.expr.HDLExpression(self).bool_and(other)
-
-    def bool_or(self, other):
-        """Boolean OR."""
-        return hdl.expr.HDLExpression(self).bool_or(other)
-
-    def __eq__(self, other):
-        """Comparison."""
-        return hdl.expr.HDLExpression(self) == other
-
-    def __ne__(self, other):
-        """Not equal."""
-        return hdl.expr.HDLExpression(self) != other
-
-    def __gt__(self, other):
-        """Greater than."""
-        return hdl.expr.HDLExpression(self) > other
-
-    def __lt__(self, other):
-        """Less than."""
-        return hdl.expr.HDLExpression(self) < other
-
-    def __ge__(self, other):
-        """Greater or equal."""
-        return hdl.expr.HDLExpression(self) >= other
-
-    def __le__(self, other):
-        """Less or equal."""
-        return hdl.expr.HDLExpression(self) <= other
-
     def __pos__(self):
         """Get an expression"""
         return hdl.expr.HDLExpression(self)
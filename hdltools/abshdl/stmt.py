@@ -6,7 +6,9 @@ from hdltools.abshdl import HDLObject
 class HDLStatement(HDLObject):
     """Program statement."""
 
-    _stmt_types = ["seq", "par", "null"]
+    __slots__ = ("stmt_type", "tag", "has_scope")
+
+    _stmt_types = frozenset(("seq", "par", "null"))
 
     def __init__(self, stmt_type, tag=None, has_scope=False, **kwargs):
         """Initialize."""
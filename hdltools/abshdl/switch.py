@@ -11,10 +11,14 @@ from hdltools.abshdl.macro import HDLMacroValue
 class HDLSwitch(HDLStatement):
     """Switch Statement."""
 
+    __slots__ = ("cases", "switch", "_case_list")
+
     def __init__(self, what, **kwargs):
         """Initialize."""
         super().__init__(stmt_type="seq", has_scope=False, **kwargs)
         self.cases = {}
+        # cases in insertion order, for emission
+        self._case_list = []
         if not isinstance(what, (HDLExpression, HDLSignal, HDLSignalSlice)):
             raise TypeError(
                 "only HDLExpression, HDLSignal," " HDLSignalSlice allowed"
@@ -30,13 +34,24 @@ class HDLSwitch(HDLStatement):
 
         # ideally want to detect duplicate but this could be difficult
         # with HDLExpression
-        expr_repr = case.case_value.dumps()
+        expr_repr = case.get_key()
         if expr_repr in self.cases:
             raise KeyError("trying to add duplicate case")
 
         self.cases[expr_repr] = case
+        self._case_list.append(case)
         case.set_parent(self)
 
+    def add_cases(self, *cases):
+        """Add several cases.
+
+        Cases can also be given as (value, stmts) tuples.
+        """
+        for case in cases:
+            if isinstance(case, tuple):
+                case = HDLCase(*case)
+            self.add_case(case)
+
     def get_case(self, expr):
         """Get case object."""
         if expr in self.cases:
@@ -46,12 +61,10 @@ class HDLSwitch(HDLStatement):
 
     def dumps(self):
         """Intermediate representation."""
-        ret_str = "SWITCH {} BEGIN\n".format(self.switch.dumps())
-        for expr, case in self.cases.items():
-            ret_str += case.dumps()
-
-        ret_str += "END\n"
-        return ret_str
+        parts = [f"SWITCH {self.switch.dumps()} BEGIN\n"]
+        parts.extend(case.dumps() for case in self._case_list)
+        parts.append("END\n")
+        return "".join(parts)
 
     def is_legal(self):
         """Determine legality."""
@@ -62,12 +75,16 @@ class HDLSwitch(HDLStatement):
 
     def get_scope(self):
         """Get case scopes."""
-        return [case.scope for name, case in self.cases.items()]
+        return [
+            case.scope for case in self._case_list if case._scope is not None
+        ]
 
 
 class HDLCase(HDLStatement):
     """Switch case."""
 
+    __slots__ = ("case_value", "_scope", "_key")
+
     def __init__(self, value, stmts=None, **kwargs):
         """Initialize."""
         super().__init__(has_scope=True, stmt_type="seq", **kwargs)
@@ -82,10 +99,24 @@ class HDLCase(HDLStatement):
                 'type "{}" ' "not supported".format(value.__class__.__name__)
             )
 
-        self.scope = HDLScope(scope_type="seq")
+        self._key = None
+        # allocated on first use, empty cases never need one
+        self._scope = None
         if stmts is not None:
-            for stmt in stmts:
-                self.add_to_scope(stmt)
+            self.scope.add(stmts)
+
+    @property
+    def scope(self):
+        """Get case scope."""
+        if self._scope is None:
+            self._scope = HDLScope(scope_type="seq")
+        return self._scope
+
+    def get_key(self):
+        """Get case value representation, used to identify this case."""
+        if self._key is None:
+            self._key = self.case_value.dumps()
+        return self._key
 
     def add_to_scope(self, *elements):
         """Add statement to scope."""
@@ -93,11 +124,14 @@ class HDLCase(HDLStatement):
 
     def dumps(self):
         """Intermediate representation."""
-        ret_str = "{}: BEGIN\n".format(self.case_value.dumps())
-        ret_str += "{}\n".format(self.scope.dumps())
-        ret_str += "END\n"
-
-        return ret_str
+        return "".join(
+            (
+                self.case_value.dumps(),
+                ": BEGIN\n",
+                self._scope.dumps() if self._scope is not None else "",
+                "\nEND\n",
+            )
+        )
 
     def is_legal(self):
         """Determine legality."""
@@ -1,10 +1,73 @@
 """Vector descriptor."""
 
+import weakref
+
 from hdltools.abshdl import HDLObject
 import hdltools.abshdl.expr as expr
 from hdltools.abshdl.const import HDLIntegerConstant
 import hdltools.abshdl.signal as signal
 
+# expressions for the most common bounds, constant expressions are never
+# modified in place so vectors can share them
+_SHARED_SIZES = {}
+
+
+def _wrap_int(value):
+    """Wrap integer size."""
+    if value < 0:
+        raise ValueError("only positive values allowed for sizes")
+    if value > 1:
+        return expr.HDLExpression(value)
+
+    shared = _SHARED_SIZES.get(value)
+    if shared is None:
+        shared = _SHARED_SIZES[value] = expr.HDLExpression(value)
+    return shared
+
+
+def _wrap_signal(value):
+    """Wrap signal used as size."""
+    if value.sig_type not in ("const", "var"):
+        raise ValueError(
+            "slices can only contain compile-time " "determinable values"
+        )
+    return expr.HDLExpression(value)
+
+
+def _wrap_expr(value):
+    """Expressions are used as is."""
+    return value
+
+
+# size wrappers by type, built on first use because of circular imports
+_SIZE_WRAPPERS = None
+
+
+def _wrap_size(value):
+    """Convert vector size into an expression."""
+    global _SIZE_WRAPPERS
+    if _SIZE_WRAPPERS is None:
+        _SIZE_WRAPPERS = {
+            int: _wrap_int,
+            HDLIntegerConstant: expr.HDLExpression,
+            expr.HDLExpression: _wrap_expr,
+            signal.HDLSignal: _wrap_signal,
+        }
+
+    wrapper = _SIZE_WRAPPERS.get(type(value))
+    if wrapper is not None:
+        return wrapper(value)
+
+    # subclasses
+    for _type, wrapper in _SIZE_WRAPPERS.items():
+        if isinstance(value, _type):
+            return wrapper(value)
+
+    raise TypeError(
+        "only int or HDLExpression allowed as size,"
+        " got: {}".format(value.__class__.__name__)
+    )
+
 
 class HDLVectorDescriptor(HDLObject):
     """Describe a vector signal."""
@@ -21,79 +84,54 @@ class HDLVectorDescriptor(HDLObject):
         stored_value: int, NoneType
            A stored value
         """
-        if not isinstance(
-            left_size,
-            (
-                int,
-                HDLIntegerConstant,
-                expr.HDLExpression,
-                signal.HDLSignal,
-                signal.HDLSignalPartSelect,
-            ),
-        ):
-            raise TypeError(
-                "only int or HDLExpression allowed as size,"
-                " got: {}".format(left_size.__class__.__name__)
-            )
-
-        if not isinstance(
-            right_size,
-            (int, HDLIntegerConstant, expr.HDLExpression, signal.HDLSignal),
-        ):
-            if right_size is None:
-                # take this as zero
-                right_size = 0
-            else:
-                raise TypeError("only int or HDLExpression allowed as size")
-
-        if isinstance(left_size, signal.HDLSignal):
-            if left_size.sig_type not in ("const", "var"):
-                raise ValueError(
-                    "slices can only contain compile-time "
-                    "determinable values"
-                )
-        if isinstance(right_size, signal.HDLSignal):
-            if right_size.sig_type not in ("const", "var"):
-                raise ValueError(
-                    "slices can only contain compile-time "
-                    "determinable values"
-                )
-
-        if not isinstance(stored_value, (int, (type(None)))):
-            raise TypeError("stored_value can only be int or None")
-
-        # if integer, check bounds
-        self._check_value(right_size)
-        self._check_value(left_size)
-
-        self.part_select = False
-        if isinstance(left_size, (int, HDLIntegerConstant, signal.HDLSignal)):
-            self.left_size = expr.HDLExpression(left_size)
-        elif isinstance(left_size, signal.HDLSignalPartSelect):
+        if isinstance(left_size, signal.HDLSignalPartSelect):
             self.left_size = expr.HDLExpression(left_size.offset)
             self.part_select_length = left_size.length
             self.part_select = True
         else:
-            self.left_size = left_size
-        if isinstance(right_size, (int, HDLIntegerConstant, signal.HDLSignal)):
-            self.right_size = expr.HDLExpression(right_size)
-        else:
-            self.right_size = right_size
+            self.left_size = _wrap_size(left_size)
+            self.part_select = False
+
+        if right_size is None:
+            # take this as zero
+            right_size = 0
+        self.right_size = _wrap_size(right_size)
+
+        if not isinstance(stored_value, (int, (type(None)))):
+            raise TypeError("stored_value can only be int or None")
+
+        # length is computed on first use, bounds may not be constant
+        self._len = None
 
         # check for value legality
         if stored_value is not None:
-            if (
-                HDLIntegerConstant.value_fits_width(len(self), stored_value)
-                is True
-            ):
+            width = len(self)
+            if HDLIntegerConstant.value_fits_width(width, stored_value):
                 self.stored_value = stored_value
             else:
                 raise ValueError("vector cannot hold passed stored_value")
 
-    def _check_value(self, value):
-        if isinstance(value, int):
-            if value < 0:
-                raise ValueError("only positive values allowed for sizes")
+    # descriptors with integer bounds, shared while in use
+    _interned = weakref.WeakValueDictionary()
+
+    @classmethod
+    def get(cls, left_size, right_size=None, stored_value=None):
+        """Get descriptor, sharing instances that have integer bounds."""
+        if right_size is None:
+            right_size = 0
+        if (
+            type(left_size) is not int
+            or type(right_size) is not int
+            or not isinstance(stored_value, (int, type(None)))
+        ):
+            return cls(left_size, right_size, stored_value)
+
+        key = (cls, left_size, right_size, stored_value)
+        vector = cls._interned.get(key)
+        if vector is None:
+            vector = cls(left_size, right_size, stored_value)
+            cls._interned[key] = vector
+        return vector
 
     def evaluate_right(self, **eval_scope):
         """Evaluate right side size."""
@@ -116,7 +154,9 @@ class HDLVectorDescriptor(HDLObject):
 
     def __len__(self):
         """Get vector length."""
-        return abs(int(self.left_size) - int(self.right_size)) + 1
+        if self._len is None:
+            self._len = abs(int(self.left_size) - int(self.right_size)) + 1
+        return self._len
 
     def __repr__(self, eval_scope=None):
         """Represent."""
@@ -128,7 +168,7 @@ class HDLVectorDescriptor(HDLObject):
             right_size = self.right_size
         if self.part_select is False:
             return f"[{left_size}:{right_size}]"
-        return "[{}:{:+}]".format(left_size, self.part_select_length)
+        return f"[{left_size}:{self.part_select_length:+}]"
 
     def dumps(self, eval_scope=None):
         """Dump description to string."""
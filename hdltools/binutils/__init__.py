@@ -6,22 +6,41 @@ from textx.metamodel import metamodel_from_file
 METAMODEL_FILE = pkg_resources.resource_filename(
     "hdltools", "binutils/objdump.tx"
 )
-OBJDUMP_METAMODEL = metamodel_from_file(METAMODEL_FILE)
+# built on first use, see __getattr__
+_OBJDUMP_METAMODEL = None
+
+
+def _get_metamodel():
+    """Get objdump metamodel."""
+    global _OBJDUMP_METAMODEL
+    if _OBJDUMP_METAMODEL is None:
+        _OBJDUMP_METAMODEL = metamodel_from_file(METAMODEL_FILE)
+        # addresses and opcodes come out of the parser as integers
+        _OBJDUMP_METAMODEL.register_obj_processors(
+            {"HexString": lambda value: int(value, 16)}
+        )
+    return _OBJDUMP_METAMODEL
+
+
+def __getattr__(name):
+    """Get module attribute."""
+    if name == "OBJDUMP_METAMODEL":
+        return _get_metamodel()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def parse_objdump(text):
     """Parse vecgen file."""
-    model = OBJDUMP_METAMODEL.model_from_str(text)
+    model = _get_metamodel().model_from_str(text)
     return model
 
 
 def parse_objdump_file(path):
     """Parse from file."""
-    with open(path, "r") as vecf:
-        contents = vecf.read()
-
-    return parse_objdump(contents)
+    return _get_metamodel().model_from_file(path)
 
 
 class AsmObject:
     """Assembly representation object."""
+
+    __slots__ = ()
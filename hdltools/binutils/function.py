@@ -8,37 +8,24 @@ from hdltools.binutils import AsmObject
 class AsmFunction(AsmObject):
     """Asm function."""
 
+    __slots__ = ("name", "address", "instructions")
+
     def __init__(
         self,
         name: str,
         address: int,
         instructions: Optional[Tuple[AsmInstruction]] = None,
-        **kwargs
+        **kwargs,
     ):
         """Initialize."""
         super().__init__(**kwargs)
-        self._name = name
-        self._addr = address
+        self.name = name
+        self.address = address
         if instructions is not None:
-            self._instructions = instructions
+            self.instructions = instructions
         else:
-            self._instructions = []
-
-    @property
-    def name(self):
-        """Get name."""
-        return self._name
-
-    @property
-    def address(self):
-        """Get address."""
-        return self._addr
-
-    @property
-    def instructions(self):
-        """Get instructions."""
-        return self._instructions
+            self.instructions = []
 
     def __repr__(self):
         """Get representation."""
-        return "{} @{}".format(self.name, hex(self.address))
+        return f"{self.name} @{self.address:#x}"
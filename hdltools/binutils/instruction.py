@@ -1,5 +1,6 @@
 """Assembly instruction."""
 
+import sys
 from typing import Optional, Any
 from enum import Enum, auto
 from hdltools.binutils import AsmObject
@@ -62,6 +63,15 @@ class MetaAsmInstruction(type):
 class AsmInstruction(AsmObject, metaclass=MetaAsmInstruction):
     """Asm instruction."""
 
+    __slots__ = (
+        "address",
+        "opcode",
+        "prefixes",
+        "mnemonic",
+        "operands",
+        "parent",
+    )
+
     _CLASS = InstructionClass.UNKNOWN
     _TYPE = InstructionType.UNKNOWN
 
@@ -71,34 +81,32 @@ class AsmInstruction(AsmObject, metaclass=MetaAsmInstruction):
         opcode: int,
         asm: Optional[str] = None,
         parent: Optional[Any] = None,
-        **kwargs
+        **kwargs,
     ):
         """Initialize."""
         super().__init__(**kwargs)
-        self._addr = address
-        self._opcode = opcode
-        self._asm = asm
-        self._parent = parent
-
-    @property
-    def address(self):
-        """Get Address."""
-        return self._addr
-
-    @property
-    def opcode(self):
-        """Get opcode."""
-        return self._opcode
+        self.address = address
+        self.opcode = opcode
+        if asm is not None:
+            # mnemonics and prefixes repeat a lot, share them
+            prefixes, mnemonic, operands = _split_asm(asm)
+            self.prefixes = sys.intern(prefixes)
+            self.mnemonic = sys.intern(mnemonic)
+            self.operands = operands
+        else:
+            self.prefixes = None
+            self.mnemonic = None
+            self.operands = None
+        self.parent = parent
 
     @property
     def assembly(self):
         """Get assembly text."""
-        return self._asm
-
-    @property
-    def parent(self):
-        """Get parent."""
-        return self._parent
+        if self.mnemonic is None:
+            return None
+        if self.operands:
+            return f"{self.prefixes}{self.mnemonic} {self.operands}"
+        return f"{self.prefixes}{self.mnemonic}"
 
     @property
     def instruction_class(self):
@@ -112,6 +120,75 @@ class AsmInstruction(AsmObject, metaclass=MetaAsmInstruction):
 
     def __repr__(self):
         """Get representation."""
-        return "{}: {} ({})".format(
-            hex(self.address), hex(self.opcode), self.assembly
-        )
+        return f"{self.address:#x}: {self.opcode:#x} ({self.assembly})"
+
+
+class AsmReturnInstruction(AsmInstruction):
+    """Return from subroutine."""
+
+    __slots__ = ()
+
+    _CLASS = InstructionClass.JUMP
+    _TYPE = JumpInstructionType.RETURN
+
+
+# specialized instruction classes by mnemonic
+INSTRUCTIONS_BY_MNEMONIC = {
+    mnemonic: AsmReturnInstruction
+    for mnemonic in (
+        "ret",
+        "retq",
+        "retl",
+        "retw",
+        "retn",
+        "retf",
+        "lret",
+        "iret",
+        "iretd",
+        "iretq",
+        "reti",
+        "mret",
+        "sret",
+        "uret",
+    )
+}
+
+# prefixes that can precede a mnemonic in objdump output
+_PREFIXES = frozenset(
+    ("rep", "repz", "repe", "repnz", "repne", "lock", "bnd", "notrack")
+)
+
+
+def _split_asm(asm):
+    """Split assembly text into prefix text, mnemonic and operands."""
+    rest = asm
+    while True:
+        stripped = rest.lstrip(" ")
+        mnemonic, _, operands = stripped.partition(" ")
+        if mnemonic not in _PREFIXES or not operands.strip(" "):
+            return (asm[: len(asm) - len(stripped)], mnemonic, operands)
+        rest = operands
+
+
+def get_mnemonic(asm):
+    """Get instruction mnemonic from assembly text."""
+    return _split_asm(asm)[1]
+
+
+def _split_encoding(asm_txt):
+    """Split trailing opcode bytes from assembly text."""
+    # long encodings are dumped as space-separated bytes, padded and followed
+    # by a tab, only the first byte is matched by the grammar
+    head, sep, tail = asm_txt.partition("\t")
+    if not sep or not head.endswith(" "):
+        return ("", asm_txt)
+    try:
+        int(head.replace(" ", ""), 16)
+    except ValueError:
+        return ("", asm_txt)
+    return (head.replace(" ", ""), tail)
+
+
+def get_instruction_class(asm):
+    """Get instruction class from assembly text."""
+    return INSTRUCTIONS_BY_MNEMONIC.get(get_mnemonic(asm), AsmInstruction)
@@ -1,10 +1,28 @@
 """Visit and parse objdump."""
 
 from scoff.ast.visits import ASTVisitor
-from hdltools.binutils.instruction import AsmInstruction
+from hdltools.binutils.instruction import (
+    get_instruction_class,
+    _split_encoding,
+)
 from hdltools.binutils.function import AsmFunction
 
 
+def _get_opcode(node):
+    """Get full opcode and assembly text of an instruction."""
+    extra, asm_txt = _split_encoding(node.asm_txt)
+    if not extra:
+        return (node.opcode, asm_txt)
+    return ((node.opcode << 4 * len(extra)) | int(extra, 16), asm_txt)
+
+
+def _make_instruction(node, parent):
+    """Build instruction from parsed node."""
+    opcode, asm_txt = _get_opcode(node)
+    asm_txt = asm_txt.replace("\t", " ")
+    return get_instruction_class(asm_txt)(node.addr, opcode, asm_txt, parent)
+
+
 class AsmDumpPass(ASTVisitor):
     """Visit objdump output."""
 
@@ -12,25 +30,18 @@ class AsmDumpPass(ASTVisitor):
         """Initialize."""
         self._visited = False
         super().__init__()
-        self._fn_locs = {}
         self._fn_by_name = {}
 
     def visit_Function(self, node):
         """Visit function."""
-        self._fn_locs[node.header.symbol.name] = int(node.header.addr, 16)
+        # instructions are built here instead of being visited one by one
+        instructions = [
+            _make_instruction(instruction, node)
+            for instruction in node.instructions
+            if not isinstance(instruction, str)
+        ]
         self._fn_by_name[node.header.symbol.name] = AsmFunction(
-            node.header.symbol.name,
-            int(node.header.addr, 16),
-            node.instructions,
-        )
-
-    def visit_Instruction(self, node):
-        """Visit instruction."""
-        return AsmInstruction(
-            int(node.addr, 16),
-            int(node.opcode, 16),
-            node.asm_txt.replace("\t", " "),
-            node.parent,
+            node.header.symbol.name, node.header.addr, instructions
         )
 
     def get_functions(self):
@@ -3,20 +3,20 @@
 from hdltools.binutils.passes import AsmDumpPass
 from hdltools.binutils import parse_objdump
 from hdltools.binutils.function import AsmFunction
+from hdltools.binutils.instruction import JumpInstructionType
 
 
 def get_boundaries(fn):
     """Get function boundaries."""
     if not isinstance(fn, AsmFunction):
         raise TypeError("fn must be AsmFunction object")
-    start = fn.address
-    candidates = []
-    for instruction in fn.instructions:
-        # HACK: no time to implement properly
-        if "ret" in instruction.assembly:
-            candidates.append(instruction.address)
-
-    return (start, max(candidates))
+    end = max(
+        instruction.address
+        for instruction in fn.instructions
+        if instruction.instruction_type is JumpInstructionType.RETURN
+    )
+
+    return (fn.address, end)
 
 
 def fn_boundary(asmdump, fn_name):
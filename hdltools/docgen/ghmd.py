@@ -28,15 +28,11 @@ class GHMarkDownTable(MarkDownString):
 
     def dumps(self):
         """Dump Table."""
-        ret_str = ' | '.join(self.headers) + '\n'
-        hyphens = ['-'*len(x) for x in self.headers]
-        ret_str += ' | '.join(hyphens) + '\n'
+        parts = [' | '.join(self.headers),
+                 ' | '.join('-'*len(x) for x in self.headers)]
+        parts.extend(' | '.join(map(str, line)) for line in self.lines)
 
-        for line in self.lines:
-            the_line = [str(x) for x in line]
-            ret_str += ' | '.join(the_line) + '\n'
-
-        return ret_str
+        return '\n'.join(parts) + '\n'
 
 
 class GHMarkDownTaskList(MarkDownString):
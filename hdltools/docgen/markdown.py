@@ -82,14 +82,12 @@ class MarkDownList(MarkDownString):
 
     def dumps(self):
         """Dump list string."""
-        ret_str = ""
-        for count, item in enumerate(self.items):
-            if self.ordered is False:
-                ret_str += "* {}\n".format(str(item))
-            else:
-                ret_str += "{}. {}\n".format(count + 1, str(item))
+        if self.ordered is False:
+            return "".join(f"* {item}\n" for item in self.items)
 
-        return ret_str
+        return "".join(
+            f"{count}. {item}\n" for count, item in enumerate(self.items, 1)
+        )
 
 
 class MarkDownLink(MarkDownString):
@@ -118,15 +116,11 @@ class MarkDownQuote(MarkDownString):
 
     def dumps(self):
         """Dump quoted text."""
-        ret_str = ""
-        for line in self.text.split("\n"):
-            if self.gobble is True:
-                the_line = str(line).strip()
-            else:
-                the_line = str(line)
-            ret_str += "> {}\n".format(the_line)
+        lines = self.text.split("\n")
+        if self.gobble is True:
+            lines = (line.strip() for line in lines)
 
-        return ret_str
+        return "".join(f"> {line}\n" for line in lines)
 
 
 class MarkDownCode(MarkDownString):
@@ -149,11 +143,11 @@ class MarkDownDocument(MarkDownObject):
         self.elements = []
 
     def append(self, element, newline=False):
-        """Add element to document."""
-        self.elements.append(element)
+        """Add element to document, rendering it immediately."""
+        self.elements.append(str(element))
         if newline is True:
             self.elements.append("\n")
 
     def dumps(self):
         """Dump document."""
-        return "".join([str(x) for x in self.elements])
+        return "".join(self.elements)
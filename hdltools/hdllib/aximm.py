@@ -1,5 +1,7 @@
 """AXI Memory Mapped Slave Model."""
 
+from functools import lru_cache
+
 from ..abshdl.module import HDLModule, HDLModuleParameter
 from ..abshdl.port import HDLModulePort
 from ..abshdl.expr import HDLExpression
@@ -10,11 +12,16 @@ from ..abshdl.ifelse import HDLIfElse
 from ..abshdl.switch import HDLSwitch, HDLCase
 from ..abshdl.loop import HDLForLoop
 from .patterns import (
-    get_clock_rst_block,
+    make_clk_rst_factory,
     get_any_sequential_block,
     get_reset_if_else,
 )
-import math
+
+
+@lru_cache(maxsize=None)
+def _expr(text):
+    """Get expression, parsing each distinct text only once."""
+    return HDLExpression(text)
 
 
 def get_register_write_logic(
@@ -26,9 +33,13 @@ def get_register_write_logic(
     after = loop_variable.assign(loop_variable + 1)
     loop = HDLForLoop(initial, expr, after)
 
-    data = axi_wdata.part_select(loop_variable * 8, 8)
-    assign = register.part_select(loop_variable * 8, 8).assign(data)
-    loop.add_to_scope(HDLIfElse(axi_wstrb[loop_variable] == 1, if_scope=assign))
+    # byte offset is shared by both part selects
+    bit_off = loop_variable * 8
+    data = axi_wdata.part_select(bit_off, 8)
+    assign = register.part_select(bit_off, 8).assign(data)
+    loop.add_to_scope(
+        HDLIfElse(axi_wstrb[loop_variable] == 1, if_scope=assign)
+    )
 
     return loop
 
@@ -38,14 +49,14 @@ def get_axi_mm_slave(mod_name, data_width, register_count):
     # module object
     mod = HDLModule(module_name=mod_name)
 
-    # addr lsb bits
-    lsb_bits = (HDLExpression("C_S_AXI_DATA_WIDTH") / 32) + 1
-
     # caculate minimum address width: resolve immediately, do not depend
-    # on parameters (could also evaluate lsb_bits with C_S_AXI_DATA_WIDTH=32)
-    eval_lsb = lsb_bits.evaluate(C_S_AXI_DATA_WIDTH=data_width)
-    addr_bits = int(math.ceil(math.log2(register_count))) + 1
-    addr_len = addr_bits + int(eval_lsb)
+    # on parameters; addr lsb bits are C_S_AXI_DATA_WIDTH/32 + 1
+    eval_lsb = data_width // 32 + 1
+    if register_count < 1:
+        raise ValueError("register count must be positive")
+    # ceil(log2(register_count)), exact for any count
+    addr_bits = (register_count - 1).bit_length() + 1
+    addr_len = addr_bits + eval_lsb
 
     # create standard parameters
     param_list = [
@@ -57,32 +68,22 @@ def get_axi_mm_slave(mod_name, data_width, register_count):
     port_list = [
         HDLModulePort("in", "S_AXI_ACLK"),
         HDLModulePort("in", "S_AXI_ARESETN"),
-        HDLModulePort(
-            "in", "S_AXI_AWADDR", size=HDLExpression("C_S_AXI_ADDR_WIDTH")
-        ),
+        HDLModulePort("in", "S_AXI_AWADDR", size=_expr("C_S_AXI_ADDR_WIDTH")),
         HDLModulePort("in", "S_AXI_AWPROT", size=3),
         HDLModulePort("in", "S_AXI_AWVALID"),
         HDLModulePort("out", "S_AXI_AWREADY"),
-        HDLModulePort(
-            "in", "S_AXI_WDATA", size=HDLExpression("C_S_AXI_DATA_WIDTH")
-        ),
-        HDLModulePort(
-            "in", "S_AXI_WSTRB", size=HDLExpression("C_S_AXI_DATA_WIDTH/8")
-        ),
+        HDLModulePort("in", "S_AXI_WDATA", size=_expr("C_S_AXI_DATA_WIDTH")),
+        HDLModulePort("in", "S_AXI_WSTRB", size=_expr("C_S_AXI_DATA_WIDTH/8")),
         HDLModulePort("in", "S_AXI_WVALID"),
         HDLModulePort("out", "S_AXI_WREADY"),
         HDLModulePort("out", "S_AXI_BRESP", size=2),
         HDLModulePort("out", "S_AXI_BVALID"),
         HDLModulePort("in", "S_AXI_BREADY"),
-        HDLModulePort(
-            "in", "S_AXI_ARADDR", size=HDLExpression("C_S_AXI_ADDR_WIDTH")
-        ),
+        HDLModulePort("in", "S_AXI_ARADDR", size=_expr("C_S_AXI_ADDR_WIDTH")),
         HDLModulePort("in", "S_AXI_ARPROT", size=3),
         HDLModulePort("in", "S_AXI_ARVALID"),
         HDLModulePort("out", "S_AXI_ARREADY"),
-        HDLModulePort(
-            "out", "S_AXI_RDATA", size=HDLExpression("C_S_AXI_DATA_WIDTH")
-        ),
+        HDLModulePort("out", "S_AXI_RDATA", size=_expr("C_S_AXI_DATA_WIDTH")),
         HDLModulePort("out", "S_AXI_RRESP", size=2),
         HDLModulePort("out", "S_AXI_RVALID"),
         HDLModulePort("in", "S_AXI_RREADY"),
@@ -91,145 +92,124 @@ def get_axi_mm_slave(mod_name, data_width, register_count):
     # add stuff to module
     mod.add_parameters(param_list)
     mod.add_ports(port_list)
+    ports = {port.name: port for port in port_list}
 
     # create some signals
-    def body_1():
-        yield HDLSignal(
-            "reg", "axi_awaddr", size=HDLExpression("C_S_AXI_ADDR_WIDTH")
-        )
-        yield HDLSignal("reg", "axi_awready")
-        yield HDLSignal("reg", "axi_wready")
-        yield HDLSignal("reg", "axi_bresp", size=2)
-        yield HDLSignal("reg", "axi_bvalid")
-        yield HDLSignal(
-            "reg", "axi_araddr", size=HDLExpression("C_S_AXI_ADDR_WIDTH")
-        )
-        yield HDLSignal("reg", "axi_arready")
-        yield HDLSignal(
-            "reg", "axi_rdata", size=HDLExpression("C_S_AXI_DATA_WIDTH")
-        )
-        yield HDLSignal("reg", "axi_rresp", size=2)
-        yield HDLSignal("reg", "axi_rvalid")
-        yield HDLSignal(
+    axi_awready = HDLSignal("reg", "axi_awready")
+    axi_wready = HDLSignal("reg", "axi_wready")
+    axi_bresp = HDLSignal("reg", "axi_bresp", size=2)
+    axi_bvalid = HDLSignal("reg", "axi_bvalid")
+    axi_arready = HDLSignal("reg", "axi_arready")
+    axi_rdata = HDLSignal("reg", "axi_rdata", size=_expr("C_S_AXI_DATA_WIDTH"))
+    axi_rresp = HDLSignal("reg", "axi_rresp", size=2)
+    axi_rvalid = HDLSignal("reg", "axi_rvalid")
+    body_1 = [
+        HDLSignal("reg", "axi_awaddr", size=_expr("C_S_AXI_ADDR_WIDTH")),
+        axi_awready,
+        axi_wready,
+        axi_bresp,
+        axi_bvalid,
+        HDLSignal("reg", "axi_araddr", size=_expr("C_S_AXI_ADDR_WIDTH")),
+        axi_arready,
+        axi_rdata,
+        axi_rresp,
+        axi_rvalid,
+        HDLSignal(
             "const",
             "ADDR_LSB",
             size=None,
-            default_val=HDLExpression("C_S_AXI_DATA_WIDTH/32+1"),
-        )
-        yield HDLSignal(
+            default_val=_expr("C_S_AXI_DATA_WIDTH/32+1"),
+        ),
+        HDLSignal(
             "const", "OPT_MEM_ADDR_BITS", size=None, default_val=addr_bits
-        )
-        yield HDLComment("Register Space", tag="REG_DECL")
-        yield HDLSignal("comb", "slv_reg_rden")
-        yield HDLSignal("comb", "slv_reg_wren")
-        yield HDLSignal(
-            "reg", "reg_data_out", size=HDLExpression("C_S_AXI_DATA_WIDTH")
-        )
-        yield HDLSignal("var", "byte_index", size=None, var_type=None)
-        yield "I/O Connection assignments"
-        yield HDLAssignment(
-            mod.get_port("S_AXI_AWREADY"), mod.get_signal("axi_awready")
-        )
-        yield HDLAssignment(
-            mod.get_port("S_AXI_WREADY"), mod.get_signal("axi_wready")
-        )
-        yield HDLAssignment(
-            mod.get_port("S_AXI_BRESP"), mod.get_signal("axi_bresp")
-        )
-        yield HDLAssignment(
-            mod.get_port("S_AXI_BVALID"), mod.get_signal("axi_bvalid")
-        )
-        yield HDLAssignment(
-            mod.get_port("S_AXI_ARREADY"), mod.get_signal("axi_arready")
-        )
-        yield HDLAssignment(
-            mod.get_port("S_AXI_RDATA"), mod.get_signal("axi_rdata")
-        )
-        yield HDLAssignment(
-            mod.get_port("S_AXI_RRESP"), mod.get_signal("axi_rresp")
-        )
-        yield HDLAssignment(
-            mod.get_port("S_AXI_RVALID"), mod.get_signal("axi_rvalid")
-        )
-        yield HDLComment("User logic", tag="USER_LOGIC")
+        ),
+        HDLComment("Register Space", tag="REG_DECL"),
+        HDLSignal("comb", "slv_reg_rden"),
+        HDLSignal("comb", "slv_reg_wren"),
+        HDLSignal("reg", "reg_data_out", size=_expr("C_S_AXI_DATA_WIDTH")),
+        HDLSignal("var", "byte_index", size=None, var_type=None),
+        "I/O Connection assignments",
+        HDLAssignment(ports["S_AXI_AWREADY"], axi_awready),
+        HDLAssignment(ports["S_AXI_WREADY"], axi_wready),
+        HDLAssignment(ports["S_AXI_BRESP"], axi_bresp),
+        HDLAssignment(ports["S_AXI_BVALID"], axi_bvalid),
+        HDLAssignment(ports["S_AXI_ARREADY"], axi_arready),
+        HDLAssignment(ports["S_AXI_RDATA"], axi_rdata),
+        HDLAssignment(ports["S_AXI_RRESP"], axi_rresp),
+        HDLAssignment(ports["S_AXI_RVALID"], axi_rvalid),
+        HDLComment("User logic", tag="USER_LOGIC"),
+    ]
 
     # add declarations
-    mod.add(body_1())
+    mod.add(body_1)
 
     # access signals in python scope
-    clk = mod.get_port("S_AXI_ACLK")
-    rst = mod.get_port("S_AXI_ARESETN")
-    axi_awready = mod.get_signal("axi_awready")
-    axi_wready = mod.get_signal("axi_wready")
-    axi_awaddr = mod.get_signal("axi_awaddr")
-    slv_reg_wren = mod.get_signal("slv_reg_wren")
-    axi_bvalid = mod.get_signal("axi_bvalid")
-    AWVALID = mod.get_port("S_AXI_AWVALID")
-    WVALID = mod.get_port("S_AXI_WVALID")
-    AWADDR = mod.get_port("S_AXI_AWADDR")
-    ADDR_LSB = mod.get_signal("ADDR_LSB")
-    OPT_MEM_ADDR_BITS = mod.get_signal("OPT_MEM_ADDR_BITS")
-
     sig = mod.get_signal_scope()
+    clk = ports["S_AXI_ACLK"]
+    rst = ports["S_AXI_ARESETN"]
+    axi_awaddr = sig["axi_awaddr"]
+    slv_reg_wren = sig["slv_reg_wren"]
+    AWVALID = ports["S_AXI_AWVALID"]
+    WVALID = ports["S_AXI_WVALID"]
+    AWADDR = ports["S_AXI_AWADDR"]
+    ADDR_LSB = sig["ADDR_LSB"]
+    OPT_MEM_ADDR_BITS = sig["OPT_MEM_ADDR_BITS"]
+
+    # all clocked blocks share clock and active-low reset
+    get_block = make_clk_rst_factory(-clk, -rst, "rise", 0)
+
+    # logic, added to the module all at once
+    top_stmts = []
+
+    # address / data handshake, the condition is copied by HDLIfElse
+    handshake = (~axi_awready).bool_and(+AWVALID).bool_and(+WVALID)
 
     # inner if-else
     innerifelse = HDLIfElse(
-        (~axi_awready).bool_and(+AWVALID).bool_and(+WVALID),
+        handshake,
         if_scope=axi_awready.assign(1),
         else_scope=axi_awready.assign(0),
     )
 
-    seq = get_clock_rst_block(
-        -clk,
-        -rst,
-        "rise",
-        0,
+    seq = get_block(
         rst_stmts=axi_awready.assign(0),
         stmts=innerifelse,
         tag="awready_gen",
     )
 
-    mod.add([seq])
+    top_stmts.append(seq)
 
     # awaddr latching
     innerifelse = HDLIfElse(
-        (~axi_awready).bool_and(+AWVALID).bool_and(+WVALID),
+        handshake,
         if_scope=axi_awaddr.assign(-AWADDR),
     )
 
-    seq = get_clock_rst_block(
-        -clk,
-        -rst,
-        "rise",
-        0,
+    seq = get_block(
         rst_stmts=axi_awaddr.assign(0),
         stmts=innerifelse,
         tag="awadr_latch",
     )
 
-    mod.add([seq])
+    top_stmts.append(seq)
 
     # wready generation
     innerifelse = HDLIfElse(
-        (~axi_awready).bool_and(+AWVALID).bool_and(+WVALID),
+        handshake,
         if_scope=axi_wready.assign(1),
         else_scope=axi_wready.assign(0),
     )
 
-    seq = get_clock_rst_block(
-        -clk,
-        -rst,
-        "rise",
-        0,
+    seq = get_block(
         rst_stmts=axi_wready.assign(0),
         stmts=innerifelse,
         tag="wready_gen",
     )
 
-    mod.add([seq])
+    top_stmts.append(seq)
 
     # slave write enable
-    mod.add(
+    top_stmts.extend(
         [
             "generate slave write enable",
             slv_reg_wren.assign(
@@ -248,17 +228,13 @@ def get_axi_mm_slave(mod_name, data_width, register_count):
     def_case = HDLCase("default")
     switch.add_case(def_case)
     innerif = HDLIfElse(slv_reg_wren, if_scope=switch)
-    seq = get_clock_rst_block(
-        -clk,
-        -rst,
-        "rise",
-        0,
+    seq = get_block(
         rst_stmts=make_comment("Reset Registers", tag="REG_RESET"),
         stmts=innerif,
         tag="reg_write",
     )
 
-    mod.add([seq])
+    top_stmts.append(seq)
 
     # write response logic
     innerifelse = HDLIfElse(
@@ -274,17 +250,13 @@ def get_axi_mm_slave(mod_name, data_width, register_count):
         ),
     )
 
-    seq = get_clock_rst_block(
-        -clk,
-        -rst,
-        "rise",
-        0,
+    seq = get_block(
         rst_stmts=(sig["axi_bvalid"].assign(0), sig["axi_bresp"].assign(0)),
         stmts=innerifelse,
         tag="wr_resp_logic",
     )
 
-    mod.add(["Write response logic", seq])
+    top_stmts.extend(("Write response logic", seq))
 
     # arready generation
     innerifelse = HDLIfElse(
@@ -296,17 +268,13 @@ def get_axi_mm_slave(mod_name, data_width, register_count):
         else_scope=sig["axi_arready"].assign(0),
     )
 
-    seq = get_clock_rst_block(
-        -clk,
-        -rst,
-        "rise",
-        0,
+    seq = get_block(
         rst_stmts=(sig["axi_arready"].assign(0), sig["axi_araddr"].assign(0)),
         stmts=innerifelse,
         tag="arready_gen",
     )
 
-    mod.add(["axi_arready generation", seq])
+    top_stmts.extend(("axi_arready generation", seq))
 
     # arvalid generation
     innerifelse = HDLIfElse(
@@ -320,20 +288,16 @@ def get_axi_mm_slave(mod_name, data_width, register_count):
         ),
     )
 
-    seq = get_clock_rst_block(
-        -clk,
-        -rst,
-        "rise",
-        0,
+    seq = get_block(
         rst_stmts=(sig["axi_rvalid"].assign(0), sig["axi_rresp"].assign(0)),
         stmts=innerifelse,
         tag="arvalid_gen",
     )
 
-    mod.add(["arvalid generation", seq])
+    top_stmts.extend(("arvalid generation", seq))
 
     # register selection
-    mod.add(
+    top_stmts.extend(
         [
             "Register select and read logic",
             sig["slv_reg_rden"].assign(
@@ -354,26 +318,24 @@ def get_axi_mm_slave(mod_name, data_width, register_count):
         )
     )
 
-    mod.add([seq])
+    top_stmts.append(seq)
 
     # data output
     innerif = HDLIfElse(
         sig["slv_reg_rden"],
         if_scope=sig["axi_rdata"].assign(sig["reg_data_out"]),
     )
-    seq = get_clock_rst_block(
-        -clk,
-        -rst,
-        "rise",
-        0,
+    seq = get_block(
         rst_stmts=sig["axi_rdata"].assign(0),
         stmts=innerif,
         tag="data_out",
     )
 
-    mod.add(["data output", seq])
+    top_stmts.extend(("data output", seq))
 
     # user logic assignments
-    mod.add([HDLComment("Output assignment", tag="OUTPUT_ASSIGN")])
+    top_stmts.append(HDLComment("Output assignment", tag="OUTPUT_ASSIGN"))
+
+    mod.add(top_stmts)
 
     return mod
@@ -1,10 +1,12 @@
 """Finite state machines."""
 
+import ast
+import dis
 import inspect
-import math
-import re
-from collections import OrderedDict
+import operator
+import textwrap
 from functools import wraps
+from itertools import product
 
 from hdltools.abshdl.assign import HDLAssignment
 from hdltools.abshdl.comment import HDLComment
@@ -22,9 +24,366 @@ class FSMInvalidStateError(Exception):
     """Invalid FSM state error."""
 
 
+def _is_state_target(node, self_name):
+    """Get whether node is the state attribute of the FSM."""
+    return (
+        isinstance(node, ast.Attribute)
+        and node.attr == "state"
+        and isinstance(node.value, ast.Name)
+        and node.value.id == self_name
+    )
+
+
+# statements that may skip assignments, or run them other than in order
+_CONTROL_FLOW = tuple(
+    getattr(ast, name)
+    for name in (
+        "If",
+        "IfExp",
+        "For",
+        "AsyncFor",
+        "While",
+        "Try",
+        "TryStar",
+        "With",
+        "AsyncWith",
+        "Match",
+        "Return",
+        "Raise",
+        "Assert",
+        "Break",
+        "Continue",
+        "FunctionDef",
+        "AsyncFunctionDef",
+        "Lambda",
+        "ClassDef",
+    )
+    if hasattr(ast, name)
+)
+
+
+def _get_next_states(method):
+    """Get states assigned by a state method, None if not all are literal."""
+    try:
+        source = textwrap.dedent(inspect.getsource(method))
+    except (OSError, TypeError):
+        return None
+    fn_def = ast.parse(source).body[0]
+    if not isinstance(fn_def, ast.FunctionDef) or not fn_def.args.args:
+        return None
+    self_name = fn_def.args.args[0].arg
+    body = ast.Module(body=fn_def.body, type_ignores=[])
+    if any(isinstance(node, _CONTROL_FLOW) for node in ast.walk(body)):
+        # conditional assignments must be confirmed by execution
+        return None
+
+    next_states = []
+    # uses of self that only store a literal state
+    state_stores = set()
+    for node in ast.walk(body):
+        if (
+            not isinstance(node, ast.Assign)
+            or not isinstance(node.value, ast.Constant)
+            or not isinstance(node.value.value, str)
+        ):
+            continue
+        for target in node.targets:
+            if _is_state_target(target, self_name):
+                state_stores.add(target.value)
+                next_states.append(node.value.value)
+
+    if not next_states:
+        return None
+    for node in ast.walk(body):
+        if not isinstance(node, ast.Name):
+            continue
+        if node.id == "super" or (
+            node.id == self_name and node not in state_stores
+        ):
+            # state may also be written elsewhere, only execution can tell
+            return None
+
+    return next_states
+
+
+# builtins through which a function can read its arguments indirectly
+_DYNAMIC_LOCALS = frozenset(("locals", "vars", "eval", "exec"))
+
+
+def _get_read_args(method, args):
+    """Get arguments of a state method that are read by its code."""
+    code = method.__code__
+    if _DYNAMIC_LOCALS.intersection(code.co_names):
+        return set(args)
+    # arguments captured by nested scopes are always considered read
+    read_args = set(args).intersection(code.co_cellvars)
+    for instr in dis.get_instructions(code):
+        if not instr.opname.startswith("LOAD_FAST"):
+            continue
+        if isinstance(instr.argval, tuple):
+            read_args.update(instr.argval)
+        else:
+            read_args.add(instr.argval)
+    return read_args & set(args)
+
+
+# paths explored with symbolic inputs before falling back to enumeration
+_MAX_SYMBOLIC_PATHS = 256
+# branches taken along a single path, loops on inputs may never end
+_MAX_SYMBOLIC_DECISIONS = 64
+
+
+class _SymbolicInputError(Exception):
+    """Symbolic input used in a way that cannot be explored."""
+
+
+class _BranchExplorer:
+    """Depth-first enumeration of branch decisions."""
+
+    def __init__(self, sizes):
+        """Initialize."""
+        self.decisions = []
+        self.conditions = []
+        self.position = 0
+        self.sizes = sizes
+        # checking paths should not cost more than enumerating inputs
+        self.budget = 1
+        for size in sizes.values():
+            self.budget *= size
+
+    def decide(self, condition):
+        """Get decision for the next branch taken."""
+        if self.position == _MAX_SYMBOLIC_DECISIONS:
+            raise _SymbolicInputError("too many branches taken")
+        if self.position == len(self.decisions):
+            self.decisions.append(False)
+        decision = self.decisions[self.position]
+        self.conditions.append(condition)
+        self.position += 1
+        return decision
+
+    def next_path(self):
+        """Advance to the next unexplored path, False if all were taken."""
+        del self.decisions[self.position :]
+        while self.decisions and self.decisions[-1]:
+            self.decisions.pop()
+        if not self.decisions:
+            return False
+        self.decisions[-1] = True
+        self.conditions = []
+        self.position = 0
+        return True
+
+    def is_feasible(self):
+        """Get whether some input values take the current path."""
+        # conditions on disjoint inputs are checked independently
+        groups = []
+        for condition, decision in zip(self.conditions, self.decisions):
+            inputs = set(condition.inputs)
+            constraints = [(condition, decision)]
+            for group in list(groups):
+                if group[0] & inputs:
+                    inputs |= group[0]
+                    constraints.extend(group[1])
+                    groups.remove(group)
+            groups.append((inputs, constraints))
+
+        return all(
+            self._is_satisfiable(sorted(inputs), constraints)
+            for inputs, constraints in groups
+        )
+
+    def _is_satisfiable(self, names, constraints):
+        """Get whether some values of inputs meet all constraints."""
+        if len(names) == 1 and all(
+            condition.bound is not None for condition, _ in constraints
+        ):
+            return _within_bounds(constraints, self.sizes[names[0]])
+
+        values = [range(self.sizes[name]) for name in names]
+        for combination in product(*values):
+            self.budget -= 1
+            if self.budget < 0:
+                raise _SymbolicInputError("path is too costly to check")
+            env = dict(zip(names, combination))
+            try:
+                if all(
+                    bool(condition.evaluate(env)) == decision
+                    for condition, decision in constraints
+                ):
+                    return True
+            except (ArithmeticError, TypeError, ValueError) as ex:
+                raise _SymbolicInputError("cannot evaluate") from ex
+        return False
+
+
+# comparison that holds when another one is false
+_NEGATED_COMPARISONS = {
+    operator.eq: operator.ne,
+    operator.ne: operator.eq,
+    operator.lt: operator.ge,
+    operator.ge: operator.lt,
+    operator.gt: operator.le,
+    operator.le: operator.gt,
+}
+
+
+def _within_bounds(constraints, size):
+    """Get whether an input value meets comparisons with constants."""
+    low, high = 0, size - 1
+    equal = set()
+    excluded = set()
+    for condition, decision in constraints:
+        op, value = condition.bound
+        if not decision:
+            op = _NEGATED_COMPARISONS[op]
+        if op is operator.eq:
+            equal.add(value)
+        elif op is operator.ne:
+            excluded.add(value)
+        elif op is operator.lt:
+            high = min(high, value - 1)
+        elif op is operator.le:
+            high = min(high, value)
+        elif op is operator.gt:
+            low = max(low, value + 1)
+        else:
+            low = max(low, value)
+
+    if equal:
+        value = equal.pop()
+        return not equal and low <= value <= high and value not in excluded
+    return sum(low <= value <= high for value in excluded) <= high - low
+
+
+def _symbolic_value(value):
+    """Get evaluation function and inputs of an operand."""
+    if isinstance(value, _SymbolicValue):
+        return (value.evaluate, value.inputs)
+    return (lambda env: value, frozenset())
+
+
+def _make_symbolic_unop(op):
+    """Make unary operator deriving a symbolic value."""
+
+    def unop(self):
+        evaluate = self.evaluate
+        return _SymbolicValue(
+            self._explorer, lambda env: op(evaluate(env)), self.inputs
+        )
+
+    return unop
+
+
+def _make_symbolic_comparison(op):
+    """Make comparison deriving a symbolic value."""
+    binop = _make_symbolic_binop(op)
+
+    def comparison(self, other):
+        value = binop(self, other)
+        if self.is_input and isinstance(other, int):
+            # comparisons of inputs with constants are checked directly
+            value.bound = (op, other)
+        return value
+
+    return comparison
+
+
+def _make_symbolic_binop(op, reflected=False):
+    """Make binary operator deriving a symbolic value."""
+
+    def binop(self, other):
+        lhs, lhs_inputs = _symbolic_value(self)
+        rhs, rhs_inputs = _symbolic_value(other)
+        if reflected:
+            lhs, rhs = rhs, lhs
+        return _SymbolicValue(
+            self._explorer,
+            lambda env: op(lhs(env), rhs(env)),
+            lhs_inputs | rhs_inputs,
+        )
+
+    return binop
+
+
+class _SymbolicValue:
+    """Input value standing for all of its values during FSM inference."""
+
+    __slots__ = ("_explorer", "evaluate", "inputs", "is_input", "bound")
+
+    def __init__(self, explorer, evaluate, inputs, is_input=False):
+        """Initialize."""
+        self._explorer = explorer
+        self.evaluate = evaluate
+        self.inputs = inputs
+        self.is_input = is_input
+        self.bound = None
+
+    def __bool__(self):
+        """Take one of both branches."""
+        return self._explorer.decide(self)
+
+    def _unsupported(self, *args):
+        raise _SymbolicInputError("input value is needed")
+
+    def __getattr__(self, name):
+        """Refuse integer attributes."""
+        self._unsupported()
+
+    __eq__ = _make_symbolic_comparison(operator.eq)
+    __ne__ = _make_symbolic_comparison(operator.ne)
+    __lt__ = _make_symbolic_comparison(operator.lt)
+    __le__ = _make_symbolic_comparison(operator.le)
+    __gt__ = _make_symbolic_comparison(operator.gt)
+    __ge__ = _make_symbolic_comparison(operator.ge)
+    __and__ = _make_symbolic_binop(operator.and_)
+    __rand__ = _make_symbolic_binop(operator.and_, True)
+    __or__ = _make_symbolic_binop(operator.or_)
+    __ror__ = _make_symbolic_binop(operator.or_, True)
+    __xor__ = _make_symbolic_binop(operator.xor)
+    __rxor__ = _make_symbolic_binop(operator.xor, True)
+    __lshift__ = _make_symbolic_binop(operator.lshift)
+    __rlshift__ = _make_symbolic_binop(operator.lshift, True)
+    __rshift__ = _make_symbolic_binop(operator.rshift)
+    __rrshift__ = _make_symbolic_binop(operator.rshift, True)
+    __add__ = _make_symbolic_binop(operator.add)
+    __radd__ = _make_symbolic_binop(operator.add, True)
+    __sub__ = _make_symbolic_binop(operator.sub)
+    __rsub__ = _make_symbolic_binop(operator.sub, True)
+    __mul__ = _make_symbolic_binop(operator.mul)
+    __rmul__ = _make_symbolic_binop(operator.mul, True)
+    __truediv__ = _make_symbolic_binop(operator.truediv)
+    __rtruediv__ = _make_symbolic_binop(operator.truediv, True)
+    __floordiv__ = _make_symbolic_binop(operator.floordiv)
+    __rfloordiv__ = _make_symbolic_binop(operator.floordiv, True)
+    __mod__ = _make_symbolic_binop(operator.mod)
+    __rmod__ = _make_symbolic_binop(operator.mod, True)
+    __pow__ = _make_symbolic_binop(operator.pow)
+    __rpow__ = _make_symbolic_binop(operator.pow, True)
+    __invert__ = _make_symbolic_unop(operator.invert)
+    __neg__ = _make_symbolic_unop(operator.neg)
+    __pos__ = _make_symbolic_unop(operator.pos)
+    __abs__ = _make_symbolic_unop(operator.abs)
+    __index__ = __int__ = __float__ = __complex__ = _unsupported
+    __hash__ = __iter__ = __len__ = __getitem__ = _unsupported
+
+
 class FSMProxy:
     """Proxy object for FSM inference."""
 
+    __slots__ = (
+        "initial",
+        "signal_scope",
+        "_type",
+        "name",
+        "state_var_name",
+        "_state_transitions",
+        "_current_state",
+        "_state_methods",
+        "_state_names",
+        "_state_index",
+    )
+
     def __init__(
         self,
         fsm_type,
@@ -40,9 +399,14 @@ class FSMProxy:
         self._type = fsm_type
         self.name = instance_name
         self.state_var_name = state_var_name
+        # transitions are kept as bitmasks of next state indices
         self._state_transitions = {}
         self._current_state = initial
         self._state_methods = state_methods
+        self._state_names = list(state_methods)
+        self._state_index = {
+            name: index for index, name in enumerate(self._state_names)
+        }
         self.__infer_fsm()
 
     @property
@@ -59,35 +423,106 @@ class FSMProxy:
     def state(self, next_state):
         """Set current state."""
         if self._current_state is None:
-            self.current_state = self.initial
-        if self._current_state not in self._state_transitions:
-            self._state_transitions[self._current_state] = set()
-
-        cur_trans = self._state_transitions[self._current_state]
-
-        if next_state not in self._state_methods:
+            self._current_state = self.initial
+        if next_state not in self._state_index:
             raise FSMInvalidStateError(
                 "invalid state name: {}".format(next_state)
             )
 
-        cur_trans |= set([next_state])
+        transitions = self._state_transitions
+        transitions[self._current_state] = transitions.get(
+            self._current_state, 0
+        ) | (1 << self._state_index[next_state])
 
     def __infer_fsm(self):
         """Infer FSM."""
         for state_name, (method, inputs) in self._state_methods.items():
             self._current_state = state_name
-            for _input in inputs:
-                signal = self.signal_scope[_input]
-                for i in range(0, 2 ** len(signal)):
-                    method(self, i)
-            if len(inputs) == 0:
-                method(self)
-
-        return self._state_transitions
+            next_states = _get_next_states(method)
+            if next_states is not None:
+                for next_state in next_states:
+                    self.state = next_state
+                continue
+
+            read_inputs = _get_read_args(method, inputs)
+            if read_inputs and self.__explore(method, inputs, read_inputs):
+                continue
+
+            # try out every combination of input values, a single value for
+            # inputs that are never read
+            names = sorted(inputs)
+            values = [
+                (
+                    range(2 ** len(self.signal_scope[name]))
+                    if name in read_inputs
+                    else (0,)
+                )
+                for name in names
+            ]
+            for combination in product(*values):
+                method(self, **dict(zip(names, combination)))
+
+        return self.get_transition_map()
+
+    def __explore(self, method, inputs, read_inputs):
+        """Take every feasible branch with symbolic inputs."""
+        transitions = self._state_transitions.get(self._current_state)
+        explorer = _BranchExplorer(
+            {name: 2 ** len(self.signal_scope[name]) for name in read_inputs}
+        )
+        kwargs = dict.fromkeys(inputs, 0)
+        for name in read_inputs:
+            kwargs[name] = _SymbolicValue(
+                explorer, operator.itemgetter(name), frozenset((name,)), True
+            )
+        for _ in range(_MAX_SYMBOLIC_PATHS):
+            taken = self._state_transitions.get(self._current_state)
+            try:
+                feasible = self.__take_path(method, kwargs, explorer)
+            except _SymbolicInputError:
+                # only enumeration can tell
+                break
+            if not feasible:
+                # no input values take this path, drop its transitions
+                self.__set_transitions(taken)
+            if not explorer.next_path():
+                return True
+
+        # discard partial results, inputs are enumerated instead
+        self.__set_transitions(transitions)
+        return False
+
+    def __take_path(self, method, kwargs, explorer):
+        """Take a single path, get whether any input values take it."""
+        try:
+            method(self, **kwargs)
+        except FSMInvalidStateError:
+            # invalid states are only an error on paths that can be taken
+            if explorer.is_feasible():
+                raise _SymbolicInputError("invalid state may be reached")
+            return False
+        except TypeError as ex:
+            # symbolic values cannot be used by builtins
+            raise _SymbolicInputError("input value is needed") from ex
+        return explorer.is_feasible()
+
+    def __set_transitions(self, transitions):
+        """Set transitions of the current state."""
+        if transitions is None:
+            self._state_transitions.pop(self._current_state, None)
+        else:
+            self._state_transitions[self._current_state] = transitions
 
     def get_transition_map(self):
         """Get map of state transitions."""
-        return self._state_transitions
+        transition_map = {}
+        for state, mask in self._state_transitions.items():
+            transition_map[state] = set(
+                name
+                for index, name in enumerate(self._state_names)
+                if mask >> index & 1
+            )
+        return transition_map
 
 
 class FSM:
@@ -98,14 +533,21 @@ class FSM:
         cls, signal_scope, states, initial_state, instance_name, state_var_name
     ):
         # verify that signals are in scope.
-        for state_name, (method, inputs) in states.items():
-            for _input in inputs:
-                if _input not in signal_scope:
-                    raise FSMInputError(
-                        "in state '{}': input signal '{}' is not available in scope".format(
-                            state_name, _input
+        required = set()
+        for _, inputs in states.values():
+            required |= inputs
+        if required and (
+            signal_scope is None or required - signal_scope.keys()
+        ):
+            # report the first offending state, as checked in state order
+            for state_name, (method, inputs) in states.items():
+                for _input in inputs:
+                    if signal_scope is None or _input not in signal_scope:
+                        raise FSMInputError(
+                            "in state '{}': input signal '{}' is not available in scope".format(
+                                state_name, _input
+                            )
                         )
-                    )
         fsm_object = FSMProxy(
             cls.__name__,
             instance_name,
@@ -118,19 +560,27 @@ class FSM:
 
     @classmethod
     def _collect_states(cls):
-        state_methods = {}
-        for method_name, method in inspect.getmembers(cls):
-            cls_name = cls.__name__
-            m = re.match(
-                r"_{}__state_([a-zA-Z0-9_]+)".format(cls_name), method_name
-            )
-            if m is not None:
-                # found a state
-                if inspect.ismethod(method) or inspect.isfunction(method):
-                    args = set(inspect.getfullargspec(method).args)
-                    input_list = args - set(["self"])
-                    state_methods[m.group(1)] = (method, input_list)
+        # states only depend on the class, collect them once per class
+        state_methods = cls.__dict__.get("_collected_states")
+        if state_methods is not None:
+            return state_methods
 
+        state_methods = {}
+        # state methods are name-mangled, so they live in the class itself
+        prefix = "_{}__state_".format(cls.__name__)
+        for method_name, method in sorted(vars(cls).items()):
+            if not method_name.startswith(prefix):
+                continue
+            state_name = method_name[len(prefix) :]
+            if not state_name or not inspect.isfunction(method):
+                continue
+            # found a state, inputs are its positional arguments
+            code = method.__code__
+            input_list = set(code.co_varnames[: code.co_argcount])
+            input_list.discard("self")
+            state_methods[state_name] = (method, input_list)
+
+        cls._collected_states = state_methods
         return state_methods
 
     def __call__(self, fn):
@@ -173,36 +623,27 @@ class FSM:
 
         # add cases
         states = cls._collect_states()
-        cases = []
-        state_mapping = OrderedDict()
 
         fsm = cls._infer_fsm(
             _signal_scope, states, initial, instance_name, state_var
         )
 
         # set state variable size
-        state_var.set_size(int(math.ceil(math.log2(float(len(states))))))
+        # a single state still needs a 1-bit state variable
+        state_var.set_size(max(1, (len(states) - 1).bit_length()))
 
         # add switch
         sw = HDLSwitch(state_var)
         rst_if.add_to_else_scope(sw)
 
-        i = 0
-        for state in states:
-            state_mapping[state] = i
-            case = HDLCase(HDLMacroValue(state), tag=f"__autogen_case_{state}")
-            case.add_to_scope(
-                HDLComment(
-                    f"case {state}",
-                    tag=f"__autogen_case_{state}",
-                )
-            )
-            cases.append(case)
+        for i, state in enumerate(states):
+            tag = f"__autogen_case_{state}"
+            case = HDLCase(HDLMacroValue(state), tag=tag)
+            case.add_to_scope(HDLComment(f"case {state}", tag=tag))
             sw.add_case(case)
             const.append(HDLMacro(state, i))
-            i += 1
 
-        if initial in state_mapping:
+        if initial in states:
             rst_if.add_to_if_scope(
                 HDLAssignment(state_var, HDLMacroValue(initial))
             )
@@ -3,7 +3,6 @@
 from functools import wraps
 
 from hdltools.abshdl.assign import HDLAssignment
-from hdltools.abshdl.expr import HDLExpression
 from hdltools.abshdl.ifelse import HDLIfElse, HDLIfExp
 from hdltools.abshdl.module import HDLModule
 from hdltools.abshdl.port import HDLModulePort
@@ -51,6 +50,21 @@ def get_clock_rst_block(
     return seq
 
 
+def make_clk_rst_factory(clock_signal, rst_signal, clk_edge, rst_lvl):
+    """Get a builder of clocked blocks sharing clock and reset."""
+    clk_sens = HDLSensitivityDescriptor(clk_edge, clock_signal)
+    # any non-zero level means active high
+    rst_cmp = rst_signal == int(bool(rst_lvl))
+
+    def get_block(rst_stmts, stmts=None, **kwargs):
+        # sensitivity lists are mutable, only the descriptor is shared
+        seq = HDLSequentialBlock(HDLSensitivityList(clk_sens), **kwargs)
+        seq.add(HDLIfElse(rst_cmp, if_scope=rst_stmts, else_scope=stmts))
+        return seq
+
+    return get_block
+
+
 def get_any_sequential_block(*stmts, **kwargs):
     """Get a block that is sensitive to anything."""
     any_sens = HDLSensitivityDescriptor("any")
@@ -63,10 +77,8 @@ def get_any_sequential_block(*stmts, **kwargs):
 
 def get_reset_if_else(rst_signal, rst_lvl, rst_stmts, stmts=None, **kwargs):
     """Get reset if-else."""
-    if rst_lvl == 0:
-        rst_cmp = rst_signal == 0
-    else:
-        rst_cmp = rst_signal == 1
+    # any non-zero level means active high
+    rst_cmp = rst_signal == int(bool(rst_lvl))
     ifelse = HDLIfElse(rst_cmp, if_scope=rst_stmts, else_scope=stmts)
 
     return ifelse
@@ -74,11 +86,8 @@ def get_reset_if_else(rst_signal, rst_lvl, rst_stmts, stmts=None, **kwargs):
 
 def get_module(name, inputs=None, outputs=None):
     """Get a module."""
-    module_ports = []
-    for inp in inputs:
-        module_ports.append(HDLModulePort("in", *inp))
-    for out in outputs:
-        module_ports.append(HDLModulePort("out", *out))
+    module_ports = [HDLModulePort("in", *inp) for inp in inputs or ()]
+    module_ports.extend(HDLModulePort("out", *out) for out in outputs or ())
 
     mod = HDLModule(name, ports=module_ports)
     return mod
@@ -87,6 +96,8 @@ def get_module(name, inputs=None, outputs=None):
 class SequentialBlock:
     """Sequential block decorator."""
 
+    __slots__ = ("signals", "_kwargs")
+
     def __init__(self, *args, **kwargs):
         """Initialize."""
         self.signals = args
@@ -109,9 +120,9 @@ class SequentialBlock:
         sens_descrs = []
         for arg in args:
             if isinstance(arg, (tuple, list)):
-                sens_descrs.append(HDLSensitivityDescriptor(*arg))
+                sens_descrs.append(HDLSensitivityDescriptor.get(*arg))
             else:
-                sens_descrs.append(HDLSensitivityDescriptor("rise", arg))
+                sens_descrs.append(HDLSensitivityDescriptor.get("rise", arg))
         sens_list = HDLSensitivityList(*sens_descrs)
         seq = HDLSequentialBlock(sens_list)
         return seq
@@ -120,6 +131,8 @@ class SequentialBlock:
 class ClockedBlock(SequentialBlock):
     """Clocked sequential block."""
 
+    __slots__ = ("clk", "edge")
+
     def __init__(self, clk, *args, edge="rise", **kwargs):
         """Initialize."""
         super().__init__(clk, edge, *args, **kwargs)
@@ -140,7 +153,7 @@ class ClockedBlock(SequentialBlock):
     @staticmethod
     def get(clk, edge="rise"):
         """Get Clocked block."""
-        sens_list = HDLSensitivityList(HDLSensitivityDescriptor(edge, clk))
+        sens_list = HDLSensitivityList(HDLSensitivityDescriptor.get(edge, clk))
         seq = HDLSequentialBlock(sens_list)
         return seq
 
@@ -148,6 +161,8 @@ class ClockedBlock(SequentialBlock):
 class ClockedRstBlock(ClockedBlock):
     """Clocked sequential block with reset."""
 
+    __slots__ = ("rst", "lvl")
+
     def __init__(self, clk, rst, clk_edge="rise", rst_lvl=1, **kwargs):
         """Initialize."""
         super().__init__(clk, clk_edge, rst, **kwargs)
@@ -179,6 +194,8 @@ class ClockedRstBlock(ClockedBlock):
 class ParallelBlock:
     """Parallel scope."""
 
+    __slots__ = ()
+
     def __init__(self, *args):
         """Initialize."""
         pass
@@ -215,7 +232,8 @@ def get_multiplexer(target, select, *options):
             opt = opt.name
         # None is placeholder for last expression
         if idx < len(options) - 1:
-            _ifexp = HDLIfExp(HDLExpression(select == idx), opt, None)
+            # HDLIfExp makes its own expression out of the condition
+            _ifexp = HDLIfExp(select == idx, opt, None)
         if idx == 0:
             ifexp = _ifexp
             root_ifexp = _ifexp
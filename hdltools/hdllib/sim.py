@@ -1,5 +1,7 @@
 """Simulation Library."""
 
+from itertools import repeat
+
 from hdltools.sim import HDLSimulationObject
 from hdltools.abshdl.expr import HDLExpression
 
@@ -14,8 +16,7 @@ class HDLSimulationConstant(HDLSimulationObject):
 
     def next(self, *args, **kwargs):
         """Return the same value always."""
-        for _ in iter(int, 1):
-            yield self.value
+        yield from repeat(self.value)
 
 
 class HDLSimulationReset(HDLSimulationObject):
@@ -29,12 +30,12 @@ class HDLSimulationReset(HDLSimulationObject):
 
     def next(self, *args, **kwargs):
         """Generate value."""
+        asserted = bool(self.lvl)
         # assert reset
         for _ in range(self.delay.value):
-            yield bool(self.lvl)
+            yield asserted
         # deassert forever
-        for _ in iter(int, 1):
-            yield bool(not self.lvl)
+        yield from repeat(not asserted)
 
 
 class HDLSimulationClock(HDLSimulationObject):
@@ -50,8 +51,10 @@ class HDLSimulationClock(HDLSimulationObject):
 
     def next(self, *args, **kwargs):
         """Generate values."""
-        for _ in iter(int, 1):
-            if self._last_edge > self.period - 1:
+        # period is fixed, state stays visible while the simulation runs
+        period = int(self.period)
+        while True:
+            if self._last_edge >= period:
                 self._level = not self._level
                 self._last_edge = 1
             else:
@@ -9,9 +9,24 @@ MMAP_COMPILER_GRAMMAR = pkg_resources.resource_filename(
     "hdltools", "mmap/mmap.tx"
 )
 
-MMAP_METAMODEL = metamodel_from_file(
-    MMAP_COMPILER_GRAMMAR, classes=MMAP_AST_CLASSES
-)
+_MMAP_METAMODEL = None
+
+
+def _get_metamodel():
+    """Get mmap metamodel."""
+    global _MMAP_METAMODEL
+    if _MMAP_METAMODEL is None:
+        _MMAP_METAMODEL = metamodel_from_file(
+            MMAP_COMPILER_GRAMMAR, classes=MMAP_AST_CLASSES
+        )
+    return _MMAP_METAMODEL
+
+
+def __getattr__(name):
+    """Get module attribute."""
+    if name == "MMAP_METAMODEL":
+        return _get_metamodel()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def bitfield_pos_to_slice(pos):
@@ -67,7 +82,7 @@ class FlagPort(HDLModulePort):
 
 def parse_mmap_str(text, file_name=None):
     """Parse mmap definition."""
-    return MMAP_METAMODEL.model_from_str(text, file_name=file_name)
+    return _get_metamodel().model_from_str(text, file_name=file_name)
 
 
 def parse_mmap_file(fpath):
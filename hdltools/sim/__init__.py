@@ -72,7 +72,7 @@ class HDLSimulationObject(HDLObject):
 
     def next(self, input_states, **kwargs):
         """Get next value."""
-        for x in iter(int, 1):
+        while True:
             self._sim_time += 1
             self.set_inputs(input_states)
             self.logic(**kwargs)
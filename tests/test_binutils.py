@@ -0,0 +1,54 @@
+"""Test binutils objects."""
+
+from hdltools.binutils.instruction import (
+    AsmInstruction,
+    AsmReturnInstruction,
+    JumpInstructionType,
+    get_instruction_class,
+    get_mnemonic,
+    _split_encoding,
+)
+
+
+def test_mnemonic():
+    """Test mnemonic extraction."""
+    assert get_mnemonic("mov %rsp,%rbp") == "mov"
+    assert get_mnemonic("repz ret") == "ret"
+    assert get_mnemonic("lock cmpxchg %ecx,(%rdx)") == "cmpxchg"
+    assert get_mnemonic("rep") == "rep"
+
+    instruction = AsmInstruction(0x10, 0xC3, "repz ret")
+    assert instruction.mnemonic == "ret"
+    assert instruction.operands == ""
+    assert instruction.assembly == "repz ret"
+
+    instruction = AsmInstruction(0x10, 0xF0, "lock cmpxchg %ecx,(%rdx)")
+    assert instruction.mnemonic == "cmpxchg"
+    assert instruction.operands == "%ecx,(%rdx)"
+    assert instruction.assembly == "lock cmpxchg %ecx,(%rdx)"
+
+    assert AsmInstruction(0x10, 0x90).assembly is None
+
+
+def test_return_instruction():
+    """Test return instruction detection."""
+    assert get_instruction_class("ret") is AsmReturnInstruction
+    assert get_instruction_class("repz ret") is AsmReturnInstruction
+    assert get_instruction_class("mov %rsp,%rbp") is AsmInstruction
+
+    instruction = get_instruction_class("repz ret")(0x10, 0xC3, "repz ret")
+    assert instruction.instruction_type == JumpInstructionType.RETURN
+
+
+def test_split_encoding():
+    """Test splitting trailing opcode bytes."""
+    assert _split_encoding("89 e5             \tmov %rsp,%rbp") == (
+        "89e5",
+        "mov %rsp,%rbp",
+    )
+    assert _split_encoding("ret") == ("", "ret")
+    assert _split_encoding("mov\t%rsp,%rbp") == ("", "mov\t%rsp,%rbp")
+    assert _split_encoding("xyz \tmov %rsp,%rbp") == (
+        "",
+        "xyz \tmov %rsp,%rbp",
+    )
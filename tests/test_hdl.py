@@ -12,6 +12,10 @@ from hdltools.abshdl.sens import HDLSensitivityList, HDLSensitivityDescriptor
 from hdltools.abshdl.seq import HDLSequentialBlock
 from hdltools.abshdl.assign import HDLAssignment
 from hdltools.abshdl.concat import HDLConcatenation
+from hdltools.abshdl.scope import HDLScope
+from hdltools.abshdl.ifelse import HDLIfElse
+from hdltools.abshdl.stmt import HDLStatement
+from hdltools.abshdl.switch import HDLSwitch, HDLCase
 
 
 def test_constants():
@@ -79,6 +83,15 @@ def test_vector_descriptor():
     with pytest.raises(ValueError):
         HDLVectorDescriptor(7, stored_value=256)
 
+    # shared descriptors
+    vec = HDLVectorDescriptor.get(7)
+    assert HDLVectorDescriptor.get(7, 0) is vec
+    assert HDLVectorDescriptor.get(7, stored_value=1) is not vec
+    assert HDLVectorDescriptor.get(HDLExpression(7)) is not vec
+
+    with pytest.raises(ValueError):
+        HDLVectorDescriptor.get(-1, 0)
+
 
 def test_module_port():
     """Test ports."""
@@ -223,9 +236,22 @@ def test_hdl_signal():
     _ = my_sig[7]
     yet_another = my_sig[2:]
     _ = my_sig[:2]
+    assert my_sig[3:1] is my_sig[3:1]
+    assert my_sig[7] is my_sig[7]
+    assert len({my_sig, my_sig, my_sig[7], my_sig[7]}) == 2
+    assert my_sig in {my_sig[7]: 0, my_sig: 1}
+    assert isinstance(my_sig == my_sig, HDLExpression)
+    assert isinstance(my_sig[7] != my_sig[7], HDLExpression)
     print(yet_another.dumps())
     _ = HDLSignal("reg", "sig", HDLVectorDescriptor(1, 0))
 
+    # renaming reaches expressions built from earlier slices
+    renamed = HDLSignal("reg", "a", size=8)
+    assert str(renamed[3:0] + 1) == "(a[3:0]+1)"
+    renamed.name = "b"
+    assert str(renamed[3:0] + 1) == "(b[3:0]+1)"
+    assert str(renamed + 1) == "(b+1)"
+
     # exceptions
     with pytest.raises(ValueError):
         _ = HDLSignal("unknown", "sig", 1)
@@ -252,9 +278,20 @@ def test_sens():
 
     sens_list = HDLSensitivityList()
     sens_list.add(sens_1)
+    sens_list.add(("fall", some_signal))
+    assert len(sens_list) == 2
+    assert sens_list[1].sens_type == "fall"
+
+    with pytest.raises(TypeError):
+        sens_list.add(some_signal)
 
     print(sens_list.dumps())
 
+    # shared descriptors
+    sens_2 = HDLSensitivityDescriptor.get("rise", some_signal)
+    assert HDLSensitivityDescriptor.get("rise", some_signal) is sens_2
+    assert HDLSensitivityDescriptor.get("fall", some_signal) is not sens_2
+
 
 def test_seq():
     """Test sequential block."""
@@ -299,3 +336,88 @@ def test_concat():
     # failures
     with pytest.raises(TypeError):
         _ = HDLConcatenation(sig, "not_allowed")
+
+
+def test_scope():
+    """Test scopes."""
+    sig = HDLSignal("comb", "my_signal", size=2)
+    scope = HDLScope(scope_type="par")
+    scope.add(HDLAssignment(sig, 0))
+    scope.add([HDLAssignment(sig, 3), "a comment"])
+    scope.insert(1, HDLAssignment(sig, 1), HDLAssignment(sig, 2))
+    assert len(scope) == 5
+    assert [stmt.value.dumps() for stmt in scope[:4]] == ["0", "1", "2", "3"]
+    assert all(stmt.parent is scope for stmt in scope[:4])
+
+    with pytest.raises(ValueError):
+        scope.insert(0, HDLIfElse(HDLExpression(sig)))
+
+    assert scope.get_by_type(HDLAssignment) == list(scope[:4])
+    assert len(scope.get_by_type(HDLStatement)) == 5
+    assert scope.get_by_type(HDLSignal) == []
+
+    # generators can refer to what they added before
+    def body():
+        yield HDLAssignment(sig, 4)
+        yield HDLAssignment(sig, len(scope))
+
+    scope.add(body())
+    assert scope[-1].value.dumps() == "6"
+
+    # other scopes must be added through extend
+    other = HDLScope(scope_type="par")
+    other.add(HDLAssignment(sig, 1))
+    with pytest.raises(TypeError):
+        scope.add(other)
+    assert other[0].parent is other
+
+
+def test_scope_tags():
+    """Test tag-based insertion in nested scopes."""
+    sig = HDLSignal("reg", "my_signal", size=2)
+    ifelse = HDLIfElse(HDLExpression(sig))
+    inner = HDLAssignment(sig, 0)
+    inner.set_tag("inner")
+    ifelse.add_to_if_scope(inner)
+    seq = HDLSequentialBlock(
+        HDLSensitivityList(HDLSensitivityDescriptor("rise", sig))
+    )
+    seq.add(HDLAssignment(sig, 1), ifelse)
+    scope = HDLScope(scope_type="par")
+    scope.add(seq)
+
+    scope.insert_before("inner", HDLAssignment(sig, 2))
+    scope.insert_after("inner", HDLAssignment(sig, 3))
+    assert len(seq.scope) == 2
+    assert [stmt.value.dumps() for stmt in ifelse.if_scope] == ["2", "0", "3"]
+
+    with pytest.raises(IndexError):
+        scope.insert_before("missing", HDLAssignment(sig, 0))
+
+
+def test_switch():
+    """Test switch statement."""
+    sig = HDLSignal("reg", "my_signal", size=2)
+    switch = HDLSwitch(sig)
+    case = HDLCase(1)
+    case.add_to_scope(HDLAssignment(sig, 1), HDLAssignment(sig, 2))
+    switch.add_case(case)
+    switch.add_case(HDLCase(2))
+    switch.add_case(HDLCase(3, stmts=[HDLAssignment(sig, 0), "comment"]))
+    assert len(case.scope) == 2
+    assert len(switch.get_case("3").scope) == 2
+    assert all(
+        isinstance(stmt, HDLStatement) for stmt in switch.get_case("3").scope
+    )
+    assert switch.get_case("1") is case
+    print(switch.dumps())
+
+    switch.add_cases((4, [HDLAssignment(sig, 1)]), HDLCase(5))
+    assert len(switch.get_case("4").scope) == 1
+    assert len(switch.get_scope()) == 3
+
+    with pytest.raises(KeyError):
+        switch.add_case(HDLCase(1))
+
+    with pytest.raises(TypeError):
+        switch.add_case(case.scope)